@@ -8,7 +8,12 @@ configuration from a .env file.
 
 import os
 import sys
-from dotenv import load_dotenv
+import logging
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    sys.exit("python-dotenv not found. Install it with: pip install python-dotenv")
 
 # Add the src directory to the path so we can import the modules
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
@@ -78,6 +83,11 @@ def test_configuration():
 
 def main():
     """Main testing function."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     print("School Menu Notifier - Local Test")
     print("=" * 40)
     
@@ -111,13 +121,4 @@ def main():
         print("Please check your configuration and try again.")
 
 if __name__ == "__main__":
-    # Check if python-dotenv is available
-    try:
-        from dotenv import load_dotenv
-    except ImportError:
-        print("python-dotenv not found. Installing...")
-        import subprocess
-        subprocess.run(["pip", "install", "python-dotenv"])
-        from dotenv import load_dotenv
-    
-    main() 
\ No newline at end of file
+    main()
@@ -4,5 +4,7 @@ Common utilities for the School Menu Notifier package.
 
 from .config import Config
 from .email_sender import EmailSender
+from .menu_cache import MenuCache, RedisMenuCache, create_menu_cache
+from .scheduler import run_scheduled
 
-__all__ = ["Config", "EmailSender"]
+__all__ = ["Config", "EmailSender", "MenuCache", "RedisMenuCache", "create_menu_cache", "run_scheduled"]
@@ -6,12 +6,73 @@ import os
 import logging
 from typing import List
 
+from .http import API_BASE_URL
+
 logger = logging.getLogger(__name__)
 
+# Per-user default for MENU_CACHE_DIR, so other local users cannot plant or read cached responses
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'school-menu-notifier'
+)
+
+# String settings loaded from the environment: (attribute, env variable, default)
+ENV_DEFAULTS = (
+    ('school_id', 'SCHOOL_ID', '2f37947e-6d30-4bb3-a306-7f69a3b3ed62'),
+    ('grade', 'GRADE', '01'),
+    ('serving_line', 'SERVING_LINE', 'Main Line'),
+    ('meal_type', 'MEAL_TYPE', 'Lunch'),
+    ('sender_email', 'SENDER_EMAIL', ''),
+    ('sender_password', 'SENDER_PASSWORD', ''),
+    ('smtp_server', 'SMTP_SERVER', 'smtp.gmail.com'),
+    ('cache_dir', 'MENU_CACHE_DIR', DEFAULT_CACHE_DIR),
+    ('redis_url', 'REDIS_URL', ''),
+    ('daemon_cron', 'DAEMON_CRON', ''),
+)
+
+# Integer settings loaded from the environment: (attribute, env variable, default)
+INT_ENV_DEFAULTS = (
+    ('smtp_port', 'SMTP_PORT', 587),
+    ('cache_ttl', 'MENU_CACHE_TTL', 43200),
+)
+
+# Boolean settings loaded from the environment: (attribute, env variable)
+BOOL_ENV_SETTINGS = (
+    ('test_run', 'TEST_RUN'),
+    ('daemon', 'DAEMON'),
+    ('send_on_weekends', 'SEND_ON_WEEKENDS'),
+)
+
+# Values (case-insensitive) that turn a boolean setting on
+TRUE_VALUES = frozenset(('1', 'true', 'yes'))
+
+# Settings shown by log_config: (env variable, attribute, masked)
+LOGGED_SETTINGS = (
+    ('SCHOOL_ID', 'school_id', False),
+    ('GRADE', 'grade', False),
+    ('SERVING_LINE', 'serving_line', False),
+    ('MEAL_TYPE', 'meal_type', False),
+    ('SMTP_SERVER', 'smtp_server', False),
+    ('SMTP_PORT', 'smtp_port', False),
+    ('SENDER_EMAIL', 'sender_email', True),
+    ('RECIPIENT_EMAIL', 'recipient_emails', True),
+    ('MENU_CACHE_DIR', 'cache_dir', False),
+    ('MENU_CACHE_TTL', 'cache_ttl', False),
+    ('REDIS_URL', 'redis_url', True),
+)
+
 
 class Config:
     """Handles configuration loading and validation for the School Menu Notifier."""
     
+    # Fixed attribute layout: every setting is known up front
+    __slots__ = tuple(
+        [attr for attr, _, _ in ENV_DEFAULTS]
+        + [attr for attr, _, _ in INT_ENV_DEFAULTS]
+        + [attr for attr, _ in BOOL_ENV_SETTINGS]
+        + ['recipient_emails', 'api_base_url']
+    )
+    
     def __init__(self):
         """Initialize configuration from environment variables."""
         self.load_config()
@@ -20,42 +81,13 @@ class Config:
     
     def load_config(self):
         """Load configuration from environment variables with defaults."""
-        # School configuration
-        self.school_id = os.getenv('SCHOOL_ID', '').strip()
-        if not self.school_id:
-            self.school_id = '2f37947e-6d30-4bb3-a306-7f69a3b3ed62'
+        # String settings; empty or unset variables fall back to the default
+        for attr, env_name, default in ENV_DEFAULTS:
+            setattr(self, attr, os.getenv(env_name, '').strip() or default)
         
-        self.grade = os.getenv('GRADE', '').strip()
-        if not self.grade:
-            self.grade = '01'
-        
-        self.serving_line = os.getenv('SERVING_LINE', '').strip()
-        if not self.serving_line:
-            self.serving_line = 'Main Line'
-        
-        self.meal_type = os.getenv('MEAL_TYPE', '').strip()
-        if not self.meal_type:
-            self.meal_type = 'Lunch'
-        
-        # Email configuration
-        self.sender_email = os.getenv('SENDER_EMAIL', '').strip()
-        self.sender_password = os.getenv('SENDER_PASSWORD', '').strip()
-        
-        # SMTP configuration
-        self.smtp_server = os.getenv('SMTP_SERVER', '').strip()
-        if not self.smtp_server:
-            self.smtp_server = 'smtp.gmail.com'
-        
-        smtp_port_str = os.getenv('SMTP_PORT', '').strip()
-        if smtp_port_str:
-            try:
-                self.smtp_port = int(smtp_port_str)
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid SMTP_PORT '{smtp_port_str}', using default 587")
-                self.smtp_port = 587
-        else:
-            logger.info("SMTP_PORT not set, using default 587")
-            self.smtp_port = 587
+        # Integer settings; invalid values fall back to the default
+        for attr, env_name, default in INT_ENV_DEFAULTS:
+            setattr(self, attr, self._get_int_env(env_name, default))
         
         # Recipients
         recipient_email = os.getenv('RECIPIENT_EMAIL', '').strip()
@@ -70,14 +102,31 @@ class Config:
             self.recipient_emails.extend(additional_list)
         
         # Remove duplicates while preserving order
-        seen = set()
-        self.recipient_emails = [email for email in self.recipient_emails if not (email in seen or seen.add(email))]
+        self.recipient_emails = list(dict.fromkeys(self.recipient_emails))
         
-        # Test mode
-        self.test_run = os.getenv('TEST_RUN', 'false').lower() == 'true'
+        # Flags: test mode, daemon mode (long-running scheduler instead of a one-shot run)
+        # and whether weekend dates still get a no-menu email
+        for attr, env_name in BOOL_ENV_SETTINGS:
+            setattr(self, attr, os.getenv(env_name, '').strip().lower() in TRUE_VALUES)
         
         # API configuration
-        self.api_base_url = 'https://webapis.schoolcafe.com/api/CalendarView/GetDailyMenuitemsByGrade'
+        self.api_base_url = API_BASE_URL
+
+    def _get_int_env(self, env_name: str, default: int) -> int:
+        """Read a non-negative integer environment variable, falling back to a default."""
+        value_str = os.getenv(env_name, '').strip()
+        if not value_str:
+            logger.debug("%s not set, using default %s", env_name, default)
+            return default
+        
+        try:
+            value = int(value_str)
+            if value < 0:
+                raise ValueError(f"{env_name} must not be negative")
+            return value
+        except (ValueError, TypeError):
+            logger.warning("Invalid %s '%s', using default %s", env_name, value_str, default)
+            return default
     
     def validate_config(self):
         """Validate required configuration."""
@@ -95,17 +144,19 @@ class Config:
     
     def log_config(self):
         """Log configuration (without sensitive data)."""
-        logger.info("Environment variables:")
-        logger.info(f"  SCHOOL_ID: {self.school_id or 'NOT_SET'}")
-        logger.info(f"  GRADE: {self.grade or 'NOT_SET'}")
-        logger.info(f"  SERVING_LINE: {self.serving_line or 'NOT_SET'}")
-        logger.info(f"  MEAL_TYPE: {self.meal_type or 'NOT_SET'}")
-        logger.info(f"  SMTP_SERVER: {self.smtp_server or 'NOT_SET'}")
-        logger.info(f"  SMTP_PORT: {self.smtp_port or 'NOT_SET'}")
-        logger.info(f"  SENDER_EMAIL: {'***' if self.sender_email else 'NOT_SET'}")
-        logger.info(f"  RECIPIENT_EMAIL: {'***' if self.recipient_emails else 'NOT_SET'}")
-        if self.test_run:
-            logger.info(f"  TEST_RUN: {self.test_run}")
+        # The per-setting dump is only useful when troubleshooting
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Environment variables:")
+            for env_name, attr, masked in LOGGED_SETTINGS:
+                value = getattr(self, attr)
+                if masked:
+                    value = '***' if value else 'NOT_SET'
+                logger.debug("  %s: %s", env_name, value)
+            if self.test_run:
+                logger.debug("  TEST_RUN: %s", self.test_run)
+            if self.daemon:
+                logger.debug("  DAEMON: %s", self.daemon)
+                logger.debug("  DAEMON_CRON: %s", self.daemon_cron or 'DEFAULT')
         
-        logger.info(f"Configuration loaded - School: {self.school_id}, Grade: {self.grade}, SMTP: {self.smtp_server}:{self.smtp_port}, TEST_RUN: {self.test_run}")
-        logger.info(f"Recipients: {len(self.recipient_emails)} email(s) configured")
+        logger.info("Configuration loaded - School: %s, Grade: %s, SMTP: %s:%s, TEST_RUN: %s", self.school_id, self.grade, self.smtp_server, self.smtp_port, self.test_run)
+        logger.info("Recipients: %s email(s) configured", len(self.recipient_emails))
@@ -2,14 +2,42 @@
 Email sending functionality for the School Menu Notifier.
 """
 
+import re
 import smtplib
+import ssl
+import time
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Port used for SMTP over implicit TLS
+SMTP_SSL_PORT = 465
+
+# Socket timeout in seconds for SMTP connections
+SMTP_TIMEOUT = 30
+
+# Seconds an idle SMTP session is kept open for reuse by the next message
+SMTP_IDLE_TIMEOUT = 100
+
+# Longest line SMTP allows in a body sent without transfer encoding (excluding CRLF)
+SMTP_MAX_LINE_LENGTH = 998
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """Return the TLS context shared by all SMTP connections, created on first use."""
+    return ssl.create_default_context()
+
+
+def minify_html(html: str) -> str:
+    """Strip the indentation from an HTML template so less of the email body is whitespace."""
+    return re.sub(r'\n[ \t]+', '\n', html)
+
 
 class EmailSender:
     """Handles email sending functionality."""
@@ -20,6 +48,113 @@ class EmailSender:
         self.smtp_port = smtp_port
         self.sender_email = sender_email
         self.sender_password = sender_password
+        self.use_ssl = smtp_port == SMTP_SSL_PORT
+        
+        # Background thread used to log in while the caller is still fetching menus
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='smtp')
+        self._pending_session: Optional[Future] = None
+        
+        # Logged-in session kept open after a send, and when it was last used
+        self._session: Optional[smtplib.SMTP] = None
+        self._session_used_at = 0.0
+    
+    def _connect(self, context: ssl.SSLContext) -> smtplib.SMTP:
+        """Open an SMTP connection, using implicit TLS on port 465 and STARTTLS otherwise."""
+        if self.use_ssl:
+            return smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT, context=context)
+        return smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+    
+    def _open_session(self) -> smtplib.SMTP:
+        """Connect and log in to the SMTP server, returning the ready session."""
+        logger.info("Connecting to SMTP server: %s:%s", self.smtp_server, self.smtp_port)
+        
+        # Reuse one context so the CA bundle is only loaded once per process
+        context = _ssl_context()
+        server = self._connect(context)
+        try:
+            if self.use_ssl:
+                logger.debug("SMTP_SSL connection established, attempting login...")
+            else:
+                logger.debug("SMTP connection established, starting TLS...")
+                server.starttls(context=context)
+                logger.debug("TLS started, attempting login...")
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        
+        logger.debug("Login successful")
+        return server
+    
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        """End an SMTP session, dropping the socket if the server does not answer QUIT."""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        """Check an open SMTP session still answers before reusing it."""
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _take_session(self) -> smtplib.SMTP:
+        """Return a logged-in session: the background one, a live idle one, or a new connection."""
+        pending, self._pending_session = self._pending_session, None
+        if pending is not None:
+            # The login may have finished long before the menu fetches did, so the
+            # server can have dropped the idle connection in the meantime
+            server = pending.result()
+            if self._is_alive(server):
+                return server
+            logger.debug("Background SMTP session was dropped - reconnecting")
+            server.close()
+            return self._open_session()
+        
+        server, self._session = self._session, None
+        if server is not None:
+            if time.monotonic() - self._session_used_at < SMTP_IDLE_TIMEOUT and self._is_alive(server):
+                logger.debug("Reusing open SMTP session")
+                return server
+            server.close()
+        
+        return self._open_session()
+    
+    def connect_in_background(self) -> None:
+        """
+        Start connecting and logging in to the SMTP server on a background thread.
+        
+        The next send_email call uses the resulting session, so the TLS handshake
+        and login overlap whatever the caller does in the meantime.
+        """
+        if self._pending_session is None and self._session is None:
+            self._pending_session = self._executor.submit(self._open_session)
+    
+    def close(self) -> None:
+        """Close the idle SMTP session and any background session that was never used."""
+        server, self._session = self._session, None
+        if server is not None:
+            self._quit(server)
+        
+        pending, self._pending_session = self._pending_session, None
+        if pending is None:
+            return
+        try:
+            self._quit(pending.result())
+        except Exception as e:
+            logger.debug("Background SMTP session was not usable: %s", e)
+    
+    def __enter__(self) -> 'EmailSender':
+        """Keep the SMTP session open for every message sent inside the with block."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the SMTP session when the with block ends."""
+        self.close()
     
     def send_email(self, subject: str, html_content: str, recipients: List[str], test_run: bool = False) -> bool:
         """
@@ -44,49 +179,63 @@ class EmailSender:
             logger.info("TEST_RUN mode - sending only to primary recipient")
         else:
             filtered_recipients = recipients
-            logger.info("Normal mode - sending to all recipients")
+            logger.debug("Normal mode - sending to all recipients")
+        
+        # Build the message once; recipients go on the envelope only so
+        # each one still receives a copy without seeing the others
+        msg = EmailMessage(policy=SMTP_POLICY)
+        msg['From'] = self.sender_email
+        msg['To'] = self.sender_email
+        msg['Subject'] = subject
+        
+        # Add HTML content; send UTF-8 as-is when every line fits SMTP's limit,
+        # since quoted-printable triples the size of each emoji or accented byte
+        fits_8bit = all(len(line.encode('utf-8')) <= SMTP_MAX_LINE_LENGTH for line in html_content.splitlines())
+        msg.set_content(html_content, subtype='html', cte='8bit' if fits_8bit else None)
+        
+        # Serialize once, before connecting, so the SMTP session is only open for delivery
+        msg_bytes = bytes(msg)
         
         try:
-            logger.info(f"Connecting to SMTP server: {self.smtp_server}:{self.smtp_port}")
+            server = self._take_session()
+            logger.debug("Sending message...")
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                logger.info("SMTP connection established, starting TLS...")
-                server.starttls()
-                logger.info("TLS started, attempting login...")
-                server.login(self.sender_email, self.sender_password)
-                logger.info("Login successful, sending messages...")
-                
-                success_count = 0
-                for recipient_email in filtered_recipients:
-                    try:
-                        # Create message
-                        msg = MIMEMultipart('alternative')
-                        msg['From'] = self.sender_email
-                        msg['To'] = recipient_email
-                        msg['Subject'] = subject
-                        
-                        # Add HTML content
-                        html_part = MIMEText(html_content, 'html')
-                        msg.attach(html_part)
-                        
-                        # Send message
-                        server.send_message(msg)
-                        logger.info(f"Email sent successfully to {recipient_email}")
-                        success_count += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to send email to {recipient_email}: {e}")
-                
-                if success_count == len(filtered_recipients):
-                    logger.info(f"All emails sent successfully to {success_count} recipient(s)")
-                    return True
-                elif success_count > 0:
-                    logger.warning(f"Partially successful: {success_count}/{len(filtered_recipients)} emails sent")
-                    return True
+            mail_options = ()
+            if fits_8bit:
+                if server.has_extn('8bitmime'):
+                    mail_options = ('BODY=8BITMIME',)
                 else:
-                    logger.error("Failed to send emails to any recipients")
-                    return False
-                    
+                    # Server only takes 7-bit bodies, so encode after all
+                    msg.set_content(html_content, subtype='html', cte='quoted-printable')
+                    msg_bytes = bytes(msg)
+            
+            # Send a single DATA transaction to all recipients
+            try:
+                refused = server.sendmail(self.sender_email, filtered_recipients, msg_bytes, mail_options=mail_options)
+            except smtplib.SMTPRecipientsRefused as e:
+                refused = e.recipients
+            except Exception:
+                server.close()
+                raise
+            
+            # Keep the session open so further messages skip the TLS handshake and login
+            self._session = server
+            self._session_used_at = time.monotonic()
+            
+            for recipient_email, error in refused.items():
+                logger.error("Failed to send email to %s: %s", recipient_email, error)
+            
+            success_count = len(filtered_recipients) - len(refused)
+            if success_count == len(filtered_recipients):
+                logger.info("All emails sent successfully to %s recipient(s)", success_count)
+                return True
+            elif success_count > 0:
+                logger.warning("Partially successful: %s/%s emails sent", success_count, len(filtered_recipients))
+                return True
+            else:
+                logger.error("Failed to send emails to any recipients")
+                return False
+                
         except Exception as e:
-            logger.error(f"SMTP connection error: {e}")
+            logger.error("SMTP connection error: %s", e)
             return False
@@ -0,0 +1,199 @@
+"""
+HTTP session setup and cached menu fetching for the SchoolCafe API.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Use orjson for faster response parsing when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# SchoolCafe endpoint returning one day's menu items for a grade and serving line
+API_BASE_URL = 'https://webapis.schoolcafe.com/api/CalendarView/GetDailyMenuitemsByGrade'
+
+# Headers sent with every SchoolCafe API request; the session already sends requests'
+# default accept-encoding (gzip and deflate, plus br/zstd when their decoders are installed)
+API_HEADERS = {
+    'accept': 'application/json, text/plain, */*',
+    'accept-language': 'en-US,en;q=0.9,es;q=0.8',
+    'origin': 'https://www.schoolcafe.com',
+    'referer': 'https://www.schoolcafe.com/'
+}
+
+# Seconds to wait for the TCP/TLS connection to the API to be established
+API_CONNECT_TIMEOUT = 5.0
+
+# Seconds to wait between bytes of the API response once connected
+API_READ_TIMEOUT = 20.0
+
+# (connect, read) timeout passed to every SchoolCafe API request
+API_TIMEOUT = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+
+# Connections the shared session keeps open to the API host; enough for the
+# weekly notifier's concurrent fetches, which is the most any caller makes
+API_POOL_MAXSIZE = 8
+
+# Response bodies the API sends for days without a menu; these skip JSON parsing
+EMPTY_MENU_BODIES = frozenset((b'', b'{}', b'[]', b'null'))
+
+# Response validators remembered per cached menu and sent back to revalidate it:
+# (response header, conditional request header)
+CONDITIONAL_HEADERS = (
+    ('ETag', 'If-None-Match'),
+    ('Last-Modified', 'If-Modified-Since'),
+)
+
+
+def create_session(pool_maxsize: int = API_POOL_MAXSIZE) -> requests.Session:
+    """
+    Create a requests session for the SchoolCafe API.
+
+    The session keeps connections alive across requests, sends the standard
+    API headers, and retries transient gateway errors with backoff.
+
+    Args:
+        pool_maxsize: Maximum number of connections kept open to the API host
+    """
+    session = requests.Session()
+    session.headers.update(API_HEADERS)
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retries)
+    session.mount('https://', adapter)
+    return session
+
+
+# Session shared by every notifier in the process, created on first use
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide API session, creating it on first use.
+
+    Daily and weekly notifiers created in the same process (daemon mode,
+    backfills) keep reusing the same warm connections, so the TLS handshake
+    to the API is paid once rather than per instance.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def _parse_menu(content: bytes, label: str, serving_date: str) -> Dict:
+    """Parse a menu response body; empty bodies and empty menus (weekends/holidays) become {}."""
+    # Empty days come back as a tiny body; don't bother parsing it
+    if content.strip() in EMPTY_MENU_BODIES:
+        logger.info("Empty %s response received for %s - likely weekend or holiday", label, serving_date)
+        return {}
+    
+    data = json_loads(content)
+    logger.info("Successfully fetched %s data with %s categories", label, len(data))
+    
+    # Check if we got an empty response (common for weekends/holidays)
+    if not data or len(data) == 0:
+        logger.info("Empty %s response received for %s - likely weekend or holiday", label, serving_date)
+        return {}  # Return empty dict instead of None
+    
+    return data
+
+
+def fetch_menu(session: requests.Session, menu_cache: Any, api_base_url: str, params: Dict[str, str],
+               label: str = "menu") -> Optional[Dict]:
+    """
+    Fetch one menu from the SchoolCafe API through the menu response cache.
+    
+    A fresh cached body skips the network; an expired one is revalidated with
+    its ETag/Last-Modified and reused on 304, and is the fallback when the API
+    cannot be reached. Only bodies that parse (or are empty) are cached, and an
+    empty day is always revalidated since its menu may be published later.
+    
+    Args:
+        session: Session used for the request
+        menu_cache: Cache from create_menu_cache
+        api_base_url: SchoolCafe endpoint URL
+        params: API query parameters (SchoolId, ServingDate, ServingLine, MealType, Grade, PersonId)
+        label: Name of the menu used in log messages
+    
+    Returns:
+        The parsed menu, {} for a day without a menu, or None on failure
+    """
+    serving_date = params['ServingDate']
+    cache_key = (params['SchoolId'], serving_date, params['ServingLine'], params['Grade'], params['MealType'])
+    
+    try:
+        content = menu_cache.get(*cache_key)
+        # An empty day is only kept as the stale copy; ask the API again in case the menu is now published
+        if content is not None and content.strip() not in EMPTY_MENU_BODIES:
+            logger.info("Using cached %s data for %s", label, serving_date)
+            return _parse_menu(content, label, serving_date)
+        
+        # Revalidate an expired cached copy instead of downloading it again
+        stale_content = menu_cache.get(*cache_key, allow_stale=True)
+        headers = {}
+        if stale_content is not None:
+            for response_header, request_header in CONDITIONAL_HEADERS:
+                validator = menu_cache.get(*cache_key, response_header, allow_stale=True)
+                if validator:
+                    headers[request_header] = validator.decode('latin-1')
+        
+        logger.info("Fetching %s data for %s", label, serving_date)
+        response = session.get(api_base_url, params=params, headers=headers, timeout=API_TIMEOUT)
+        
+        validators = {}
+        if response.status_code == 304:
+            # Without a cached copy there is nothing to reuse, and the empty 304 body is not a menu
+            if stale_content is None:
+                raise requests.exceptions.HTTPError(
+                    f"Unexpected 304 Not Modified for {label} data without a cached copy", response=response)
+            logger.info("%s data for %s not modified - reusing cached copy", label, serving_date)
+            content = stale_content
+        else:
+            response.raise_for_status()
+            logger.debug("%s response content-encoding: %s", label, response.headers.get('content-encoding', 'identity'))
+            content = response.content
+            validators = {response_header: response.headers.get(response_header) for response_header, _ in CONDITIONAL_HEADERS}
+        
+        # Parse before caching so an error page is never stored as a valid menu
+        data = _parse_menu(content, label, serving_date)
+        for response_header, validator in validators.items():
+            if validator:
+                menu_cache.set(validator.encode('latin-1'), *cache_key, response_header)
+        menu_cache.set(content, *cache_key)
+        return data
+        
+    except requests.exceptions.RequestException as e:
+        if isinstance(e, requests.exceptions.Timeout):
+            logger.error("Timed out fetching %s data (connect/read limits %s): %s", label, API_TIMEOUT, e)
+        else:
+            logger.error("Error fetching %s data: %s", label, e)
+        
+        # Fall back to the last successful response if the API is unreachable
+        stale_content = menu_cache.get(*cache_key, allow_stale=True)
+        if stale_content is not None:
+            logger.warning("Using stale cached %s data for %s", label, serving_date)
+            try:
+                return _parse_menu(stale_content, label, serving_date)
+            except json.JSONDecodeError as parse_error:
+                logger.error("Error parsing stale cached %s data: %s", label, parse_error)
+        return None
+    except json.JSONDecodeError as e:
+        logger.error("Error parsing %s JSON response: %s", label, e)
+        return None
+    except Exception as e:
+        logger.error("Unexpected error fetching %s data: %s", label, e)
+        return None
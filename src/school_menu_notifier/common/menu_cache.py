@@ -0,0 +1,213 @@
+"""
+Caching of SchoolCafe API responses for the School Menu Notifier.
+"""
+
+import os
+import re
+import time
+import hashlib
+import logging
+import tempfile
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a DAEMON mode worker holds a send lock, so other workers skip that email
+SEND_LOCK_TTL = 3600
+
+# Seconds Redis keeps the stale fallback copy of a response, so old menus do not pile up forever
+REDIS_STALE_TTL = 7 * 24 * 3600
+
+
+class MenuCache:
+    """Stores raw menu API response bodies on disk for a limited time."""
+
+    def __init__(self, cache_dir: str, ttl: int):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cached responses are written
+            ttl: Seconds a cached response stays valid; 0 disables caching
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are read from and written to the cache."""
+        return self.ttl > 0
+
+    def get_path(self, *key_parts: str) -> str:
+        """Build the cache file path for the given key parts."""
+        key = '-'.join(re.sub(r'[^A-Za-z0-9_.]+', '_', str(part)) for part in key_parts)
+        return os.path.join(self.cache_dir, f"schoolcafe-{key}.json")
+
+    def get(self, *key_parts: str, allow_stale: bool = False) -> Optional[bytes]:
+        """
+        Return the cached response body, or None if missing or expired.
+
+        With allow_stale, an expired entry is still returned; this is used as a
+        fallback when the API cannot be reached.
+        """
+        if not self.enabled:
+            return None
+
+        path = self.get_path(*key_parts)
+        try:
+            if not allow_stale and time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def set(self, content: bytes, *key_parts: str) -> None:
+        """Write a response body to the cache, ignoring filesystem errors."""
+        if not self.enabled:
+            return
+
+        path = self.get_path(*key_parts)
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial body
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write menu cache file %s: %s", path, e)
+
+    def acquire_lock(self, name: str, ttl: int) -> bool:
+        """Claim a named lock; without Redis there is nothing shared to coordinate on."""
+        return True
+
+    def release_lock(self, name: str) -> None:
+        """Release a named lock; nothing to do without Redis."""
+
+
+class RedisMenuCache:
+    """Stores raw menu API response bodies in Redis with a TTL."""
+
+    def __init__(self, client: Any, ttl: int):
+        """
+        Initialize the cache.
+
+        Args:
+            client: Redis client (or any object with get/set/setex/delete)
+            ttl: Seconds a cached response stays valid; 0 disables caching
+        """
+        self.client = client
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are read from and written to the cache."""
+        return self.ttl > 0
+
+    def get_key(self, *key_parts: str) -> str:
+        """Build the Redis key for the given key parts."""
+        digest = hashlib.sha1('\0'.join(str(part) for part in key_parts).encode('utf-8')).hexdigest()
+        return f"menu:{digest}"
+
+    def get(self, *key_parts: str, allow_stale: bool = False) -> Optional[bytes]:
+        """
+        Return the cached response body, or None if missing or expired.
+
+        With allow_stale, the last successful response is returned even after
+        its TTL has passed.
+        """
+        if not self.enabled:
+            return None
+
+        key = self.get_key(*key_parts)
+        try:
+            content = self.client.get(key)
+            if content is None and allow_stale:
+                content = self.client.get(f"{key}:stale")
+            return content
+        except Exception as e:
+            logger.warning("Could not read menu cache key %s: %s", key, e)
+            return None
+
+    def set(self, content: bytes, *key_parts: str) -> None:
+        """Write a response body to the cache, ignoring Redis errors."""
+        if not self.enabled:
+            return
+
+        key = self.get_key(*key_parts)
+        try:
+            self.client.setex(key, self.ttl, content)
+            # Longer-lived copy kept as a fallback for when the API is unreachable
+            self.client.setex(f"{key}:stale", max(self.ttl, REDIS_STALE_TTL), content)
+        except Exception as e:
+            logger.warning("Could not write menu cache key %s: %s", key, e)
+
+    def acquire_lock(self, name: str, ttl: int) -> bool:
+        """
+        Claim a named lock for ttl seconds, returning False if another process holds it.
+        
+        Lets several scheduler workers sharing one Redis agree that only one of
+        them sends a given email. Redis errors fail open so the email still goes out.
+        """
+        key = f"lock:{name}"
+        try:
+            return bool(self.client.set(key, b'1', nx=True, ex=ttl))
+        except Exception as e:
+            logger.warning("Could not acquire lock %s: %s", key, e)
+            return True
+
+    def release_lock(self, name: str) -> None:
+        """Release a named lock early, e.g. so a failed send can be retried before the TTL expires."""
+        key = f"lock:{name}"
+        try:
+            self.client.delete(key)
+        except Exception as e:
+            logger.warning("Could not release lock %s: %s", key, e)
+
+
+def send_once(cache: Any, name: Optional[str], send: Callable[[], bool], ttl: int = SEND_LOCK_TTL) -> Optional[bool]:
+    """
+    Call send() only if this worker claims the named send lock.
+
+    With several scheduler workers sharing one Redis, only the one that claims
+    the lock sends the email; the lock is released again when the send fails
+    so a retry is not blocked for the whole TTL.
+
+    Args:
+        cache: Menu cache whose backend holds the lock
+        name: Lock name for this email, or None to send without locking
+        send: Sends the email and returns whether it succeeded
+        ttl: Seconds the lock is held after a successful send
+
+    Returns:
+        None if another worker holds the lock, otherwise send()'s result
+    """
+    if name is None:
+        return send()
+    if not cache.acquire_lock(name, ttl):
+        return None
+
+    sent = False
+    try:
+        sent = send()
+    finally:
+        if not sent:
+            cache.release_lock(name)
+    return sent
+
+
+def create_menu_cache(cache_dir: str, ttl: int, redis_url: str = ''):
+    """
+    Create the menu response cache for the configured backend.
+
+    Uses Redis when a URL is given and the redis package is installed,
+    otherwise falls back to the on-disk cache.
+    """
+    if redis_url:
+        try:
+            import redis
+            return RedisMenuCache(redis.Redis.from_url(redis_url), ttl)
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed - using disk cache")
+    return MenuCache(cache_dir, ttl)
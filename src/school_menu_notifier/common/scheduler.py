@@ -0,0 +1,94 @@
+"""
+Long-running scheduler support for the School Menu Notifier.
+"""
+
+import logging
+import re
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Crontab day-of-week numbers (0 and 7 are Sunday) as names; APScheduler reads 0 as Monday
+CRON_DAY_NAMES = ('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+# One numeric day-of-week list item: *, N or N-M, with an optional /step
+_NUMERIC_DAY_ITEM = re.compile(r'^(\*|(\d)(?:-(\d))?)(?:/(\d+))?$')
+
+
+def translate_day_of_week(field: str) -> str:
+    """
+    Rewrite the numeric items of a crontab day-of-week field as day names.
+
+    Crontab counts days from Sunday = 0, while APScheduler counts from
+    Monday = 0, so e.g. '0,1-4' would otherwise fire Monday to Friday
+    instead of Sunday to Thursday. Each comma item is checked on its own:
+    items naming days (e.g. 'mon-fri/2') and a plain '*' are kept as is.
+
+    Args:
+        field: Day-of-week field of a crontab expression, e.g. '0,1-4'
+
+    Returns:
+        The field with numeric items replaced by names, e.g. 'sun,mon,tue,wed,thu'
+
+    Raises:
+        ValueError: If an item mixes numbers with names or uses days outside 0-7
+    """
+    items = []
+    for item in field.split(','):
+        days = item.split('/', 1)[0]
+        if item == '*' or (days != '*' and not any(char.isdigit() for char in days)):
+            items.append(item)
+            continue
+
+        match = _NUMERIC_DAY_ITEM.match(item)
+        if not match:
+            raise ValueError(f"Unsupported day-of-week '{item}' in '{field}' - use numbers 0-7 or names like mon-fri")
+        whole, start, end, step = match.groups()
+        if whole == '*':
+            first, last = 0, 6
+        else:
+            first = int(start)
+            last = int(end) if end is not None else (6 if step else first)
+        if last > 7 or first > last:
+            raise ValueError(f"Invalid day-of-week range '{item}' in '{field}'")
+        items.extend(CRON_DAY_NAMES[day] for day in range(first, last + 1, int(step or 1)))
+
+    return ','.join(dict.fromkeys(items))
+
+
+def translate_crontab(cron_expression: str) -> str:
+    """Return a 5-field crontab expression with its day-of-week field rewritten as names."""
+    fields = cron_expression.split()
+    if len(fields) != 5:
+        raise ValueError(f"Crontab expression must have 5 fields, got {len(fields)}: '{cron_expression}'")
+    fields[4] = translate_day_of_week(fields[4])
+    return ' '.join(fields)
+
+
+def run_scheduled(job: Callable[[], bool], cron_expression: str, timezone: str = 'UTC') -> None:
+    """
+    Run a job on a cron schedule in a blocking, long-lived process.
+
+    Keeping the process alive between runs reuses the already-imported modules,
+    loaded configuration and warm HTTP session instead of cold-starting each time.
+
+    Args:
+        job: Callable to run on each firing
+        cron_expression: Standard 5-field crontab expression; numeric days of
+            the week count from Sunday = 0 as in crontab
+        timezone: Timezone the cron expression is evaluated in
+    """
+    try:
+        from apscheduler.schedulers.blocking import BlockingScheduler
+        from apscheduler.triggers.cron import CronTrigger
+    except ImportError:
+        raise RuntimeError("DAEMON mode requires APScheduler. Install it with: pip install apscheduler")
+
+    scheduler = BlockingScheduler(timezone=timezone)
+    scheduler.add_job(job, CronTrigger.from_crontab(translate_crontab(cron_expression), timezone=timezone))
+
+    logger.info("Daemon mode - running on schedule '%s' (%s)", cron_expression, timezone)
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("Scheduler stopped")
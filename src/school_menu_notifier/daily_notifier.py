@@ -5,203 +5,48 @@ Fetches tomorrow's lunch menu and sends it via email.
 """
 
 import os
+import html
 import logging
-import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .common.config import Config
-from .common.email_sender import EmailSender
+from .common.email_sender import EmailSender, minify_html
+from .common.http import fetch_menu, get_session
+from .common.menu_cache import create_menu_cache, send_once
+from .common.scheduler import run_scheduled
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Default DAEMON mode schedule: Sunday-Thursday at 10:00 PM UTC, matching the GitHub Actions workflow
+DEFAULT_DAEMON_CRON = '0 22 * * sun,mon,tue,wed,thu'
 
-class SchoolMenuNotifier:
-    """Handles fetching and emailing daily school menu notifications."""
-
-    def __init__(self):
-        """Initialize the menu notifier with configuration."""
-        logger.info("Starting School Menu Notifier...")
-        
-        # Load configuration
-        self.config = Config()
-        
-        # Initialize email sender
-        self.email_sender = EmailSender(
-            smtp_server=self.config.smtp_server,
-            smtp_port=self.config.smtp_port,
-            sender_email=self.config.sender_email,
-            sender_password=self.config.sender_password
-        )
-        
-        logger.info("Configuration loaded successfully")
-
-    def get_target_date(self) -> str:
-        """Get the target date for menu fetching based on test mode."""
-        if self.config.test_run:
-            target_date = datetime.now()
-            logger.info("TEST_RUN is true - using today's date")
-        else:
-            target_date = datetime.now() + timedelta(days=1)
-            logger.info("Using tomorrow's date (normal operation)")
-        
-        # Check if target date is a weekend
-        if target_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            logger.info(f"Target date {target_date.strftime('%A %m/%d')} is a weekend - expecting no menu")
-        
-        return target_date.strftime('%m/%d/%Y')
+# Human-readable date used in the email subject and header, e.g. "Tuesday, August 19, 2025"
+DISPLAY_DATE_FORMAT = '%A, %B %d, %Y'
 
-    def fetch_menu_data(self, serving_date: str) -> Optional[Dict]:
-        """Fetch menu data from the SchoolCafe API."""
-        params = {
-            'SchoolId': self.config.school_id,
-            'ServingDate': serving_date,
-            'ServingLine': self.config.serving_line,
-            'MealType': self.config.meal_type,
-            'Grade': self.config.grade,
-            'PersonId': 'null'
-        }
-        
-        headers = {
-            'accept': 'application/json, text/plain, */*',
-            'accept-language': 'en-US,en;q=0.9,es;q=0.8',
-            'origin': 'https://www.schoolcafe.com',
-            'referer': 'https://www.schoolcafe.com/'
-        }
-        
-        try:
-            logger.info(f"Fetching menu data for {serving_date}")
-            response = requests.get(self.config.api_base_url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Successfully fetched menu data with {len(data)} categories")
-            
-            # Check if we got an empty response (common for weekends/holidays)
-            if not data or len(data) == 0:
-                logger.info(f"Empty response received for {serving_date} - likely weekend or holiday")
-                return {}  # Return empty dict instead of None
-            
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching menu data: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching menu data: {e}")
-            return None
+# Menu categories shown in the daily email, in display order
+MENU_CATEGORIES = ('ENTREES', 'VEGETABLES', 'FRUITS', 'MILK')
 
-    def fetch_prek_menu_data(self, serving_date: str) -> Optional[Dict]:
-        """Fetch PreK menu data from the SchoolCafe API."""
-        params = {
-            'SchoolId': self.config.school_id,
-            'ServingDate': serving_date,
-            'ServingLine': 'Main Line',  # PreK data is now served from Main Line
-            'MealType': self.config.meal_type,
-            'Grade': 'PK',
-            'PersonId': 'null'
-        }
-        
-        headers = {
-            'accept': 'application/json, text/plain, */*',
-            'accept-language': 'en-US,en;q=0.9,es;q=0.8',
-            'origin': 'https://www.schoolcafe.com',
-            'referer': 'https://www.schoolcafe.com/'
-        }
-        
-        try:
-            logger.info(f"Fetching PreK menu data for {serving_date}")
-            response = requests.get(self.config.api_base_url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Successfully fetched PreK menu data with {len(data)} categories")
-            
-            # Check if we got an empty response (common for weekends/holidays)
-            if not data or len(data) == 0:
-                logger.info(f"Empty PreK response received for {serving_date} - likely weekend or holiday")
-                return {}  # Return empty dict instead of None
-            
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching PreK menu data: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing PreK JSON response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching PreK menu data: {e}")
-            return None
-
-    def find_prek_entree(self, main_menu_data: Dict, prek_menu_data: Dict) -> Optional[str]:
-        """Find which main line entree is also served to preschoolers."""
-        if not main_menu_data or not prek_menu_data:
-            return None
-        
-        # Extract entrees from both menus
-        main_entrees = []
-        if 'ENTREES' in main_menu_data and isinstance(main_menu_data['ENTREES'], list):
-            main_entrees = [item.get('MenuItemDescription', '') for item in main_menu_data['ENTREES'] if isinstance(item, dict)]
-        
-        prek_entrees = []
-        if 'ENTREES' in prek_menu_data and isinstance(prek_menu_data['ENTREES'], list):
-            prek_entrees = [item.get('MenuItemDescription', '') for item in prek_menu_data['ENTREES'] if isinstance(item, dict)]
-        
-        # Find matching entrees
-        matching_entrees = []
-        for main_entree in main_entrees:
-            if main_entree in prek_entrees:
-                matching_entrees.append(main_entree)
-        
-        if matching_entrees:
-            logger.info(f"Found {len(matching_entrees)} matching entrees for PreK: {matching_entrees}")
-            return matching_entrees[0]  # Return the first match
-        
-        logger.info("No matching entrees found between main line and PreK")
-        return None
+# Optional per-item menu fields rendered under each item name: (key, css class, label)
+ITEM_DETAIL_FIELDS = (
+    ('ServingSizeByGrade', 'item-details', '📏 Serving Size'),
+    ('Calories', 'item-details', '🔥 Calories'),
+    ('Allergens', 'allergens', '⚠️ Allergens'),
+)
 
-    def format_menu_email(self, menu_data: Dict, serving_date: str, prek_entree: Optional[str] = None) -> str:
-        """Format the menu data into a readable email."""
-        # Convert date format for display
-        try:
-            date_obj = datetime.strptime(serving_date, '%m/%d/%Y')
-            formatted_date = date_obj.strftime('%A, %B %d, %Y')
-        except ValueError:
-            formatted_date = serving_date
-        
-        # Determine if this is a test run
-        test_run = self.config.test_run
-        
-        # Set subject and header based on test mode
-        if test_run:
-            subject = f"🧪 TEST: Today's School Lunch Menu - {formatted_date}"
-            header_text = "Today's School Lunch Menu"
-            subtitle = "Test Run"
-        else:
-            subject = f"🍽️ Tomorrow's School Lunch Menu - {formatted_date}"
-            header_text = "Tomorrow's School Lunch Menu"
-            subtitle = formatted_date
-        
-        # Start building the email content
-        email_content = f'''
+# Static HTML document head for the daily email, split around the <title> text
+_HTML_HEADER_START = minify_html('''
         <!DOCTYPE html>
         <html>
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{subject}</title>
+            <title>''')
+
+_HTML_HEADER_END = minify_html('''</title>
             <style>
-                body {{
+                body {
                     font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
                     line-height: 1.6;
                     color: #333;
@@ -209,58 +54,58 @@ class SchoolMenuNotifier:
                     margin: 0 auto;
                     padding: 20px;
                     background-color: #f9f9f9;
-                }}
-                .container {{
+                }
+                .container {
                     background-color: white;
                     border-radius: 10px;
                     padding: 30px;
                     box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                }}
-                .header {{
+                }
+                .header {
                     text-align: center;
                     border-bottom: 3px solid #4CAF50;
                     padding-bottom: 20px;
                     margin-bottom: 30px;
-                }}
-                .header h1 {{
+                }
+                .header h1 {
                     color: #2E7D32;
                     margin: 0;
                     font-size: 24px;
-                }}
-                .header p {{
+                }
+                .header p {
                     color: #666;
                     margin: 5px 0 0 0;
                     font-size: 16px;
-                }}
-                .category {{
+                }
+                .category {
                     margin: 25px 0;
                     border-left: 4px solid #4CAF50;
                     padding-left: 15px;
-                }}
-                .category h2 {{
+                }
+                .category h2 {
                     color: #2E7D32;
                     margin: 0 0 10px 0;
                     font-size: 18px;
-                }}
-                .menu-item {{
+                }
+                .menu-item {
                     background-color: #f8f9fa;
                     border-radius: 8px;
                     padding: 15px;
                     margin: 10px 0;
                     border-left: 3px solid #81C784;
-                }}
-                .item-name {{
+                }
+                .item-name {
                     font-weight: bold;
                     color: #1B5E20;
                     font-size: 16px;
                     margin-bottom: 5px;
-                }}
-                .item-details {{
+                }
+                .item-details {
                     font-size: 14px;
                     color: #555;
                     margin: 3px 0;
-                }}
-                .allergens {{
+                }
+                .allergens {
                     background-color: #FFF3E0;
                     border: 1px solid #FFB74D;
                     border-radius: 4px;
@@ -268,23 +113,23 @@ class SchoolMenuNotifier:
                     margin-top: 8px;
                     font-size: 12px;
                     color: #E65100;
-                }}
-                .no-menu {{
+                }
+                .no-menu {
                     text-align: center;
                     padding: 30px;
                     background-color: #f8f9fa;
                     border-radius: 8px;
                     margin: 20px 0;
-                }}
-                .footer {{
+                }
+                .footer {
                     text-align: center;
                     margin-top: 30px;
                     padding-top: 20px;
                     border-top: 1px solid #ddd;
                     font-size: 12px;
                     color: #666;
-                }}
-                .test-banner {{
+                }
+                .test-banner {
                     background-color: #FFF3E0;
                     border: 2px solid #FF9800;
                     border-radius: 8px;
@@ -293,36 +138,33 @@ class SchoolMenuNotifier:
                     text-align: center;
                     color: #E65100;
                     font-weight: bold;
-                }}
-                @media (max-width: 600px) {{
-                    body {{ padding: 10px; }}
-                    .container {{ padding: 20px; }}
-                    .header h1 {{ font-size: 20px; }}
-                }}
+                }
+                @media (max-width: 600px) {
+                    body { padding: 10px; }
+                    .container { padding: 20px; }
+                    .header h1 { font-size: 20px; }
+                }
             </style>
         </head>
         <body>
             <div class="container">
-        '''
-        
-        # Add test banner if in test mode
-        if test_run:
-            email_content += '''
+        ''')
+
+# Static HTML fragments for the daily email body
+_TEST_BANNER = minify_html('''
                 <div class="test-banner">
                     🧪 This is a test email - Menu shown is for today, not tomorrow
                 </div>
-            '''
-        
-        email_content += f'''
+            ''')
+
+_HEADER_TEMPLATE = minify_html('''
                 <div class="header">
                     <h1>🍽️ {header_text}</h1>
                     <p>{subtitle}</p>
                 </div>
-        '''
-        
-        # Check if we have menu data
-        if not menu_data:
-            email_content += '''
+        ''')
+
+_NO_MENU_HTML = minify_html('''
                 <div class="no-menu">
                     <h2>😴 No Menu Available</h2>
                     <p>There's no menu available for this date. This could be because:</p>
@@ -333,50 +175,9 @@ class SchoolMenuNotifier:
                         <li>There was an issue fetching the menu data</li>
                     </ul>
                 </div>
-            '''
-        else:
-            # Process each category
-            category_order = ['ENTREES', 'VEGETABLES', 'FRUITS', 'MILK']
-            total_items = 0
-            
-            for category in category_order:
-                if category in menu_data and menu_data[category]:
-                    items = menu_data[category]
-                    if isinstance(items, list) and items:
-                        email_content += f'<div class="category"><h2>{category.title()}</h2>'
-                        
-                        for item in items:
-                            if isinstance(item, dict) and 'MenuItemDescription' in item:
-                                total_items += 1
-                                
-                                # Item name with PreK indicator if applicable
-                                item_name = item["MenuItemDescription"]
-                                if prek_entree and item_name == prek_entree:
-                                    email_content += f'<div class="menu-item"><div class="item-name">{item_name} [Pre-K]</div>'
-                                else:
-                                    email_content += f'<div class="menu-item"><div class="item-name">{item_name}</div>'
-                                
-                                # Add serving size and calories if available
-                                if item.get("ServingSizeByGrade"):
-                                    email_content += f'<div class="item-details">📏 Serving Size: {item["ServingSizeByGrade"]}</div>'
-                                
-                                if item.get("Calories"):
-                                    email_content += f'<div class="item-details">🔥 Calories: {item["Calories"]}</div>'
-                                
-                                # Add allergens if present
-                                if item.get("Allergens"):
-                                    allergens = item["Allergens"].strip()
-                                    if allergens:
-                                        email_content += f'<div class="allergens">⚠️ Allergens: {allergens}</div>'
-                                
-                                email_content += '</div>'
-                        
-                        email_content += '</div>'
-            
-            logger.info(f"Formatted menu with {total_items} items")
-        
-        # Add footer
-        email_content += '''
+            ''')
+
+_HTML_FOOTER = minify_html('''
                 <div class="footer">
                     <p>Data provided by SchoolCafe</p>
                     <p>This email was automatically generated by the school-menu-notifier tool built by Nick Wilson.</p>
@@ -384,9 +185,195 @@ class SchoolMenuNotifier:
             </div>
         </body>
         </html>
-        '''
+        ''')
+
+
+class SchoolMenuNotifier:
+    """Handles fetching and emailing daily school menu notifications."""
+
+    def __init__(self):
+        """Initialize the menu notifier with configuration."""
+        logger.info("Starting School Menu Notifier...")
+        
+        # Load configuration
+        self.config = Config()
+        
+        # Initialize email sender
+        self.email_sender = EmailSender(
+            smtp_server=self.config.smtp_server,
+            smtp_port=self.config.smtp_port,
+            sender_email=self.config.sender_email,
+            sender_password=self.config.sender_password
+        )
+        
+        # Process-wide HTTP session, shared with the weekly notifier, so the main and PreK fetches
+        # and later runs reuse pooled connections
+        self.session = get_session()
+        
+        # Response cache (disk or Redis) so reruns for the same date skip the network
+        self.menu_cache = create_menu_cache(self.config.cache_dir, self.config.cache_ttl, self.config.redis_url)
+        
+        logger.info("Configuration loaded successfully")
+
+    def get_target_datetime(self) -> datetime:
+        """Get the target date for menu fetching based on test mode."""
+        if self.config.test_run:
+            target_date = datetime.now()
+            logger.info("TEST_RUN is true - using today's date")
+        else:
+            target_date = datetime.now() + timedelta(days=1)
+            logger.info("Using tomorrow's date (normal operation)")
+        
+        # Check if target date is a weekend
+        if target_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
+            logger.info("Target date %s is a weekend - expecting no menu", target_date.strftime('%A %m/%d'))
+        
+        return target_date
+
+    def get_target_date(self) -> str:
+        """Get the target date for menu fetching as an API serving date (MM/DD/YYYY)."""
+        return self.get_target_datetime().strftime('%m/%d/%Y')
+
+    def _fetch_menu(self, serving_date: str, serving_line: str, grade: str, label: str = "menu") -> Optional[Dict]:
+        """Fetch menu data for a serving line and grade from the SchoolCafe API."""
+        params = {
+            'SchoolId': self.config.school_id,
+            'ServingDate': serving_date,
+            'ServingLine': serving_line,
+            'MealType': self.config.meal_type,
+            'Grade': grade,
+            'PersonId': 'null'
+        }
+        
+        return fetch_menu(self.session, self.menu_cache, self.config.api_base_url, params, label)
+
+    def fetch_menu_data(self, serving_date: str) -> Optional[Dict]:
+        """Fetch menu data from the SchoolCafe API."""
+        return self._fetch_menu(serving_date, self.config.serving_line, self.config.grade)
+
+    def fetch_prek_menu_data(self, serving_date: str) -> Optional[Dict]:
+        """Fetch PreK menu data from the SchoolCafe API."""
+        # PreK data is now served from Main Line
+        return self._fetch_menu(serving_date, 'Main Line', 'PK', label="PreK menu")
+
+    def find_prek_entree(self, main_menu_data: Dict, prek_menu_data: Dict) -> Optional[str]:
+        """Find which main line entree is also served to preschoolers."""
+        if not main_menu_data or not prek_menu_data:
+            return None
+        
+        # Extract main entrees in order, and named PreK entrees as a set for fast lookup
+        main_entrees = []
+        if isinstance(main_menu_data.get('ENTREES'), list):
+            main_entrees = [item.get('MenuItemDescription', '') for item in main_menu_data['ENTREES'] if isinstance(item, dict)]
+        
+        prek_entrees = set()
+        if isinstance(prek_menu_data.get('ENTREES'), list):
+            prek_entrees = {item['MenuItemDescription'] for item in prek_menu_data['ENTREES']
+                            if isinstance(item, dict) and item.get('MenuItemDescription')}
         
-        return email_content
+        # Find matching entrees, preserving main line order
+        matching_entrees = [entree for entree in main_entrees if entree in prek_entrees]
+        
+        if matching_entrees:
+            logger.info("Found %s matching entrees for PreK: %s", len(matching_entrees), matching_entrees)
+            return matching_entrees[0]  # Return the first match
+        
+        logger.info("No matching entrees found between main line and PreK")
+        return None
+
+    def get_menu_categories(self, menu_data: Dict) -> List[Tuple[str, List[Dict]]]:
+        """Get the displayable (category, items) pairs from menu data in display order."""
+        categories = []
+        for category in MENU_CATEGORIES:
+            items = menu_data.get(category)
+            if not isinstance(items, list):
+                continue
+            # Items without a name have nothing to display
+            items = [item for item in items if isinstance(item, dict) and item.get('MenuItemDescription')]
+            if items:
+                categories.append((category, items))
+        return categories
+
+    def format_display_date(self, serving_date: str) -> str:
+        """Convert an API serving date (MM/DD/YYYY) into a human-readable date."""
+        try:
+            date_obj = datetime.strptime(serving_date, '%m/%d/%Y')
+            return date_obj.strftime(DISPLAY_DATE_FORMAT)
+        except ValueError:
+            return serving_date
+
+    def get_email_subject(self, formatted_date: str) -> str:
+        """Get the email subject line for a display date based on test mode."""
+        if self.config.test_run:
+            return f"🧪 TEST: Today's School Lunch Menu - {formatted_date}"
+        return f"🍽️ Tomorrow's School Lunch Menu - {formatted_date}"
+
+    def format_menu_email(self, menu_data: Dict, serving_date: str, prek_entree: Optional[str] = None,
+                          formatted_date: Optional[str] = None, subject: Optional[str] = None) -> str:
+        """Format the menu data into a readable email."""
+        # Convert date format for display unless the caller already has it
+        if formatted_date is None:
+            formatted_date = self.format_display_date(serving_date)
+        if subject is None:
+            subject = self.get_email_subject(formatted_date)
+        
+        # Determine if this is a test run
+        test_run = self.config.test_run
+        
+        # Set header based on test mode
+        if test_run:
+            header_text = "Today's School Lunch Menu"
+            subtitle = "Test Run"
+        else:
+            header_text = "Tomorrow's School Lunch Menu"
+            subtitle = formatted_date
+        
+        # Start building the email content
+        parts = [_HTML_HEADER_START, subject, _HTML_HEADER_END]
+        
+        # Add test banner if in test mode
+        if test_run:
+            parts.append(_TEST_BANNER)
+        
+        parts.append(_HEADER_TEMPLATE.format(header_text=header_text, subtitle=subtitle))
+        
+        # Check if we have menu data
+        if not menu_data:
+            parts.append(_NO_MENU_HTML)
+        else:
+            # Process each category
+            categories = self.get_menu_categories(menu_data)
+            total_items = sum(len(items) for _, items in categories)
+            
+            for category, items in categories:
+                parts.append(f'<div class="category"><h2>{category.title()}</h2>\n')
+                
+                for item in items:
+                    # Item name with PreK indicator if applicable
+                    item_name = html.escape(str(item["MenuItemDescription"]))
+                    if prek_entree and item["MenuItemDescription"] == prek_entree:
+                        item_name = f"{item_name} [Pre-K]"
+                    
+                    # Add serving size, calories and allergens if available
+                    details = []
+                    for key, css_class, label in ITEM_DETAIL_FIELDS:
+                        value = item.get(key)
+                        if isinstance(value, str):
+                            value = value.strip()
+                        if value:
+                            details.append(f'<div class="{css_class}">{label}: {html.escape(str(value))}</div>')
+                    
+                    # One fragment per item keeps the parts list short
+                    parts.append(f'<div class="menu-item"><div class="item-name">{item_name}</div>{"".join(details)}</div>\n')
+                
+                parts.append('</div>\n')
+            
+            logger.info("Formatted menu with %s items", total_items)
+        
+        # Add footer
+        parts.append(_HTML_FOOTER)
+        
+        return ''.join(parts)
 
     def send_email(self, subject: str, html_content: str) -> bool:
         """Send the menu email."""
@@ -401,42 +388,60 @@ class SchoolMenuNotifier:
         """Run the menu notifier process."""
         try:
             # Get target date
-            target_date = self.get_target_date()
+            target_datetime = self.get_target_datetime()
+            target_date = target_datetime.strftime('%m/%d/%Y')
+            
+            logger.info("Processing menu for %s: %s", 'today' if self.config.test_run else 'tomorrow', target_date)
+            
+            is_weekend = target_datetime.weekday() >= 5
+            if is_weekend and not (self.config.test_run or self.config.send_on_weekends):
+                # No school on weekends; nothing to fetch or send unless asked to
+                logger.info("Target date is a weekend - skipping notification (set SEND_ON_WEEKENDS to send anyway)")
+                return True
             
-            logger.info(f"Processing menu for {'today' if self.config.test_run else 'tomorrow'}: {target_date}")
+            # Log in to the SMTP server while the menus are being fetched
+            self.email_sender.connect_in_background()
             
-            # Fetch menu data
-            menu_data = self.fetch_menu_data(target_date)
+            if is_weekend:
+                # No school on weekends, so skip the API and send the no-menu email
+                logger.info("Skipping menu fetch for weekend date")
+                menu_data, prek_menu_data = {}, None
+            else:
+                # Fetch main and PreK menu data concurrently
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    menu_future = executor.submit(self.fetch_menu_data, target_date)
+                    prek_future = executor.submit(self.fetch_prek_menu_data, target_date)
+                    menu_data = menu_future.result()
+                    prek_menu_data = prek_future.result()
             
             if menu_data is None:
                 logger.error("Failed to fetch menu data")
                 return False
             
-            # Fetch PreK menu data and find matching entree
-            prek_menu_data = self.fetch_prek_menu_data(target_date)
+            # Find the entree served to PreK
             prek_entree = None
             if prek_menu_data:
                 prek_entree = self.find_prek_entree(menu_data, prek_menu_data)
                 if prek_entree:
-                    logger.info(f"PreK entree identified: {prek_entree}")
+                    logger.info("PreK entree identified: %s", prek_entree)
             
-            # Format email content
-            email_content = self.format_menu_email(menu_data, target_date, prek_entree)
+            # Build the display date and subject once, for both the message and its <title>
+            formatted_date = target_datetime.strftime(DISPLAY_DATE_FORMAT)
+            subject = self.get_email_subject(formatted_date)
             
-            # Determine subject
-            try:
-                date_obj = datetime.strptime(target_date, '%m/%d/%Y')
-                formatted_date = date_obj.strftime('%A, %B %d, %Y')
-            except ValueError:
-                formatted_date = target_date
+            # Format email content
+            email_content = self.format_menu_email(menu_data, target_date, prek_entree, formatted_date, subject)
             
-            if self.config.test_run:
-                subject = f"🧪 TEST: Today's School Lunch Menu - {formatted_date}"
-            else:
-                subject = f"🍽️ Tomorrow's School Lunch Menu - {formatted_date}"
+            # Send email; in daemon mode only the worker that claims the day sends it
+            lock_name = None
+            if self.config.daemon:
+                lock_name = f"daily:{self.config.school_id}:{target_date}:{self.config.recipient_emails[0]}"
+            sent = send_once(self.menu_cache, lock_name, lambda: self.send_email(subject, email_content))
+            if sent is None:
+                logger.info("Menu for %s is already being sent by another worker - skipping", target_date)
+                return True
             
-            # Send email
-            if self.send_email(subject, email_content):
+            if sent:
                 logger.info("Menu notification completed successfully")
                 return True
             else:
@@ -444,14 +449,27 @@ class SchoolMenuNotifier:
                 return False
                 
         except Exception as e:
-            logger.error(f"Error in menu notification process: {e}")
+            logger.error("Error in menu notification process: %s", e)
             return False
+        finally:
+            self.email_sender.close()
 
 
 def main():
     """Main entry point for the daily notifier."""
+    # Configure logging here rather than at import so importing the module has no side effects
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     try:
         notifier = SchoolMenuNotifier()
+        
+        if notifier.config.daemon:
+            run_scheduled(notifier.run, notifier.config.daemon_cron or DEFAULT_DAEMON_CRON)
+            return
+        
         success = notifier.run()
         
         if success:
@@ -461,7 +479,7 @@ def main():
             exit(1)
             
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         exit(1)
 
 
@@ -5,22 +5,98 @@ Fetches the upcoming week's lunch menus and sends a weekly overview email.
 """
 
 import os
+import html
 import logging
-import requests
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
 from .common.config import Config
-from .common.email_sender import EmailSender
+from .common.email_sender import EmailSender, minify_html
+from .common.http import API_POOL_MAXSIZE, fetch_menu, get_session
+from .common.menu_cache import create_menu_cache, send_once
+from .common.scheduler import run_scheduled
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Concurrent API requests per weekly run (up to five weekdays, main line and PreK each),
+# one per connection in the shared session's pool
+MAX_FETCH_WORKERS = API_POOL_MAXSIZE
+
+# Default DAEMON mode schedule: Sunday at 5:00 PM UTC, matching the GitHub Actions workflow
+DEFAULT_DAEMON_CRON = '0 17 * * sun'
+
+# Static HTML document head and styles for the weekly email
+_HTML_HEADER = minify_html("""
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #4CAF50; color: white; padding: 20px; text-align: center; border-radius: 5px; }
+        .subtitle { color: #E8F5E8; font-size: 16px; margin-top: 10px; }
+        .day-section { margin: 25px 0; border: 2px solid #4CAF50; border-radius: 8px; overflow: hidden; }
+        .day-header { background-color: #4CAF50; color: white; padding: 15px; font-size: 18px; font-weight: bold; }
+        .day-content { padding: 20px; }
+        .no-menu { color: #666; font-style: italic; text-align: center; padding: 20px; }
+        .entree-item { margin: 15px 0; padding: 15px; background-color: #f9f9f9; border-left: 4px solid #4CAF50; }
+        .entree-name { font-weight: bold; color: #333; font-size: 16px; }
+        .entree-details { color: #666; font-size: 14px; margin-top: 8px; }
+        .allergens { color: #d32f2f; font-size: 12px; margin-top: 8px; font-weight: bold; }
+        .prek-note { color: #666; font-size: 12px; font-style: italic; margin-top: 20px; text-align: center; }
+        .footer { margin-top: 30px; text-align: center; color: #666; font-size: 12px; }
+        .test-banner { background-color: #FF9800; color: white; padding: 10px; text-align: center; margin-bottom: 20px; border-radius: 5px; }
+    </style>
+</head>
+<body>
+""")
+
+# Banner shown at the top of TEST_RUN emails
+_TEST_BANNER = minify_html("""
+    <div class="test-banner">
+        🧪 <strong>TEST RUN</strong> - This is a test email showing the rest of the current week
+    </div>
+""")
+
+# Email title block; filled in with the header text and subtitle for the run mode
+_HEADER_TEMPLATE = minify_html("""
+    <div class="header">
+        <h1>🍽️ {header_text}</h1>
+        <div class="subtitle">{subtitle}</div>
+    </div>
+""")
+
+# Opening of one day's section; filled in with the day name and display date
+_DAY_HEADER_TEMPLATE = (
+    '<div class="day-section">\n'
+    '<div class="day-header">{day_name} - {display_date}</div>\n'
+    '<div class="day-content">\n'
+)
+
+# Optional per-entree menu fields rendered under each entree name: (key, label)
+ENTREE_DETAIL_FIELDS = (
+    ('ServingSizeByGrade', 'Serving'),
+    ('Calories', 'Calories'),
+    ('Allergens', '⚠️ Allergens'),
+)
+
+_HTML_FOOTER = minify_html("""
+    <div class="footer">
+        <p>This email was automatically generated by the school-menu-notifier tool built by Nick Wilson.</p>
+        <p>Data provided by SchoolCafe</p>
+    </div>
+</body>
+</html>
+""")
+
+
+def _menu_result(future: Future, label: str, serving_date: str) -> Optional[Dict]:
+    """Return a menu fetch's result, or None if it raised, so one bad day doesn't fail the week."""
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error("Error fetching %s data for %s: %s", label, serving_date, e)
+        return None
+
 
 class WeeklySchoolMenuNotifier:
     """Handles fetching and emailing weekly school menu notifications."""
@@ -40,6 +116,13 @@ class WeeklySchoolMenuNotifier:
             sender_password=self.config.sender_password
         )
         
+        # Process-wide HTTP session, shared with the daily notifier, so the week's fetches
+        # and later runs reuse pooled keep-alive connections
+        self.session = get_session()
+        
+        # Response cache (disk or Redis) so reruns for the same week skip the network
+        self.menu_cache = create_menu_cache(self.config.cache_dir, self.config.cache_ttl, self.config.redis_url)
+        
         logger.info("Configuration loaded successfully")
 
     def get_week_dates(self) -> List[Tuple[datetime, str]]:
@@ -71,60 +154,42 @@ class WeeklySchoolMenuNotifier:
                         days_until_monday = 7
                     start_date = today + timedelta(days=days_until_monday)
                     end_date = start_date
-                logger.info(f"Showing rest of week from {start_date.strftime('%A')} to {end_date.strftime('%A')}")
+                logger.info("Showing rest of week from %s to %s", start_date.strftime('%A'), end_date.strftime('%A'))
         else:
             # For normal Sunday runs, show the upcoming week
             start_date = today + timedelta(days=1)  # Monday
             end_date = start_date + timedelta(days=4)  # Friday
             logger.info("Normal operation - showing upcoming week starting Monday")
         
-        # Generate dates from start to end (inclusive)
-        week_dates = []
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Only weekdays
-                week_dates.append((current_date, current_date.strftime('%m/%d/%Y')))
-            current_date += timedelta(days=1)
+        # Generate weekdays from start to end (inclusive)
+        days = (start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1))
+        week_dates = [(day, day.strftime('%m/%d/%Y')) for day in days if day.weekday() < 5]
         
-        logger.info(f"Generated {len(week_dates)} weekdays: {[date.strftime('%A %m/%d') for date, _ in week_dates]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generated %s weekdays: %s", len(week_dates), [date.strftime('%A %m/%d') for date, _ in week_dates])
         return week_dates
 
-    def fetch_main_menu_data(self, serving_date: str) -> Optional[Dict]:
-        """Fetch main menu data from the SchoolCafe API."""
+    def _fetch_menu(self, serving_date: str, serving_line: str, grade: str, label: str = "menu") -> Optional[Dict]:
+        """Fetch menu data for a serving line and grade from the SchoolCafe API."""
         params = {
             'SchoolId': self.config.school_id,
             'ServingDate': serving_date,
-            'ServingLine': self.config.serving_line,
+            'ServingLine': serving_line,
             'MealType': self.config.meal_type,
-            'Grade': self.config.grade,
+            'Grade': grade,
             'PersonId': 'null'
         }
         
-        headers = {
-            'accept': 'application/json, text/plain, */*',
-            'accept-language': 'en-US,en;q=0.9,es;q=0.8',
-            'origin': 'https://www.schoolcafe.com',
-            'referer': 'https://www.schoolcafe.com/'
-        }
-        
-        try:
-            logger.info(f"Fetching menu data for {serving_date}")
-            response = requests.get(self.config.api_base_url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Successfully fetched main menu data with {len(data)} categories")
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching menu data: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching menu data: {e}")
-            return None
+        return fetch_menu(self.session, self.menu_cache, self.config.api_base_url, params, label)
+
+    def fetch_main_menu_data(self, serving_date: str) -> Optional[Dict]:
+        """Fetch main menu data from the SchoolCafe API."""
+        return self._fetch_menu(serving_date, self.config.serving_line, self.config.grade, label="main menu")
+
+    def fetch_prek_menu_data(self, serving_date: str) -> Optional[Dict]:
+        """Fetch PreK menu data from the SchoolCafe API."""
+        # PreK data is now served from Main Line
+        return self._fetch_menu(serving_date, 'Main Line', 'PK', label="PreK menu")
 
     def extract_entrees(self, menu_data: Dict) -> List[Dict]:
         """Extract just the entrees from menu data."""
@@ -135,78 +200,48 @@ class WeeklySchoolMenuNotifier:
                     entrees.append(entree)
         return entrees
 
-    def fetch_prek_menu_data(self, serving_date: str) -> Optional[Dict]:
-        """Fetch PreK menu data from the SchoolCafe API."""
-        params = {
-            'SchoolId': self.config.school_id,
-            'ServingDate': serving_date,
-            'ServingLine': 'Main Line',  # PreK data is now served from Main Line
-            'MealType': self.config.meal_type,
-            'Grade': 'PK',
-            'PersonId': 'null'
-        }
-        
-        headers = {
-            'accept': 'application/json, text/plain, */*',
-            'accept-language': 'en-US,en;q=0.9,es;q=0.8',
-            'origin': 'https://www.schoolcafe.com',
-            'referer': 'https://www.schoolcafe.com/'
-        }
+    def find_prek_entree(self, main_menu_data: Dict, prek_menu_data: Dict,
+                         main_entrees: Optional[List[Dict]] = None) -> Optional[str]:
+        """
+        Find which main line entree is also served to preschoolers.
         
-        try:
-            logger.info(f"Fetching PreK menu data for {serving_date}")
-            response = requests.get(self.config.api_base_url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Successfully fetched PreK menu data with {len(data)} categories")
-            
-            # Check if we got an empty response (common for weekends/holidays)
-            if not data or len(data) == 0:
-                logger.info(f"Empty PreK response received for {serving_date} - likely weekend or holiday")
-                return {}  # Return empty dict instead of None
-            
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching PreK menu data: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing PreK JSON response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching PreK menu data: {e}")
-            return None
-
-    def find_prek_entree(self, main_menu_data: Dict, prek_menu_data: Dict) -> Optional[str]:
-        """Find which main line entree is also served to preschoolers."""
+        main_entrees are the main line entrees already extracted by the caller;
+        if omitted they are extracted from main_menu_data.
+        """
         if not main_menu_data or not prek_menu_data:
             return None
         
-        # Extract entrees from both menus
-        main_entrees = []
-        if 'ENTREES' in main_menu_data and isinstance(main_menu_data['ENTREES'], list):
-            main_entrees = [item.get('MenuItemDescription', '') for item in main_menu_data['ENTREES'] if isinstance(item, dict)]
+        # Main entree names in order, and named PreK entrees as a set for fast lookup
+        if main_entrees is None:
+            main_entrees = self.extract_entrees(main_menu_data)
+        main_entrees = [item['MenuItemDescription'] for item in main_entrees]
         
-        prek_entrees = []
-        if 'ENTREES' in prek_menu_data and isinstance(prek_menu_data['ENTREES'], list):
-            prek_entrees = [item.get('MenuItemDescription', '') for item in prek_menu_data['ENTREES'] if isinstance(item, dict)]
+        prek_entrees = set()
+        if isinstance(prek_menu_data.get('ENTREES'), list):
+            prek_entrees = {item['MenuItemDescription'] for item in prek_menu_data['ENTREES']
+                            if isinstance(item, dict) and item.get('MenuItemDescription')}
         
-        # Find matching entrees
-        matching_entrees = []
-        for main_entree in main_entrees:
-            if main_entree in prek_entrees:
-                matching_entrees.append(main_entree)
+        # Find matching entrees, preserving main line order
+        matching_entrees = [entree for entree in main_entrees if entree in prek_entrees]
         
         if matching_entrees:
-            logger.info(f"Found {len(matching_entrees)} matching entrees for PreK: {matching_entrees}")
+            logger.info("Found %s matching entrees for PreK: %s", len(matching_entrees), matching_entrees)
             return matching_entrees[0]  # Return the first match
         
         logger.info("No matching entrees found between main line and PreK")
         return None
 
-    def format_weekly_email(self, week_menus: List[Tuple[datetime, str, Optional[Dict]]], prek_entrees: Dict[str, str]) -> str:
-        """Format the weekly menu data into a readable email."""
+    def format_weekly_email(self, week_menus: List[Tuple[datetime, str, Optional[Dict]]], prek_entrees: Dict[str, str],
+                            week_entrees: Optional[Dict[str, List[Dict]]] = None) -> str:
+        """
+        Format the weekly menu data into a readable email.
+        
+        week_entrees maps serving dates to entrees already extracted by the caller;
+        days not in it are extracted from their menu data.
+        """
+        if week_entrees is None:
+            week_entrees = {}
+        
         # Determine header text based on test run
         if self.config.test_run:
             header_text = "This Week's School Lunch Menu"
@@ -215,97 +250,49 @@ class WeeklySchoolMenuNotifier:
             header_text = "Next Week's School Lunch Menu"
             subtitle = "Upcoming Week"
         
-        email_content = f"""
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background-color: #4CAF50; color: white; padding: 20px; text-align: center; border-radius: 5px; }}
-        .subtitle {{ color: #E8F5E8; font-size: 16px; margin-top: 10px; }}
-        .day-section {{ margin: 25px 0; border: 2px solid #4CAF50; border-radius: 8px; overflow: hidden; }}
-        .day-header {{ background-color: #4CAF50; color: white; padding: 15px; font-size: 18px; font-weight: bold; }}
-        .day-content {{ padding: 20px; }}
-        .no-menu {{ color: #666; font-style: italic; text-align: center; padding: 20px; }}
-        .entree-item {{ margin: 15px 0; padding: 15px; background-color: #f9f9f9; border-left: 4px solid #4CAF50; }}
-        .entree-name {{ font-weight: bold; color: #333; font-size: 16px; }}
-        .entree-details {{ color: #666; font-size: 14px; margin-top: 8px; }}
-        .allergens {{ color: #d32f2f; font-size: 12px; margin-top: 8px; font-weight: bold; }}
-        .prek-note {{ color: #666; font-size: 12px; font-style: italic; margin-top: 20px; text-align: center; }}
-        .footer {{ margin-top: 30px; text-align: center; color: #666; font-size: 12px; }}
-        .test-banner {{ background-color: #FF9800; color: white; padding: 10px; text-align: center; margin-bottom: 20px; border-radius: 5px; }}
-    </style>
-</head>
-<body>
-"""
+        parts = [_HTML_HEADER]
         
         # Add test run banner if applicable
         if self.config.test_run:
-            email_content += f"""
-    <div class="test-banner">
-        🧪 <strong>TEST RUN</strong> - This is a test email showing the rest of the current week
-    </div>
-"""
+            parts.append(_TEST_BANNER)
         
-        email_content += f"""
-    <div class="header">
-        <h1>🍽️ {header_text}</h1>
-        <div class="subtitle">{subtitle}</div>
-    </div>
-"""
+        parts.append(_HEADER_TEMPLATE.format(header_text=header_text, subtitle=subtitle))
         
         # Process each day
         for date_obj, date_str, menu_data in week_menus:
             day_name = date_obj.strftime('%A')
             display_date = date_obj.strftime('%B %d, %Y')
             
-            email_content += f'<div class="day-section">\n'
-            email_content += f'<div class="day-header">{day_name} - {display_date}</div>\n'
-            email_content += '<div class="day-content">\n'
+            parts.append(_DAY_HEADER_TEMPLATE.format(day_name=day_name, display_date=display_date))
             
             if menu_data:
-                entrees = self.extract_entrees(menu_data)
+                entrees = week_entrees.get(date_str)
+                if entrees is None:
+                    entrees = self.extract_entrees(menu_data)
                 if entrees:
+                    prek_entree = prek_entrees.get(date_str)
                     for entree in entrees:
-                        email_content += '<div class="entree-item">\n'
-                        
                         # Entree name with PreK indicator if applicable
-                        entree_name = entree["MenuItemDescription"]
-                        date_key = date_obj.strftime('%m/%d/%Y')
-                        if date_key in prek_entrees and entree_name == prek_entrees[date_key]:
-                            email_content += f'<div class="entree-name">{entree_name} [Pre-K]</div>\n'
-                        else:
-                            email_content += f'<div class="entree-name">{entree_name}</div>\n'
-                        
-                        # Add serving size if available
-                        if entree.get('ServingSizeByGrade'):
-                            email_content += f'<div class="entree-details">Serving: {entree["ServingSizeByGrade"]}</div>\n'
+                        entree_name = html.escape(str(entree["MenuItemDescription"]))
+                        if prek_entree and entree["MenuItemDescription"] == prek_entree:
+                            entree_name = f"{entree_name} [Pre-K]"
                         
-                        # Add calories if available
-                        if entree.get('Calories'):
-                            email_content += f'<div class="entree-details">Calories: {entree["Calories"]}</div>\n'
+                        # Add serving size, calories and allergens if available
+                        details = ''.join(f'<div class="entree-details">{label}: {html.escape(str(entree[key]))}</div>\n'
+                                          for key, label in ENTREE_DETAIL_FIELDS if entree.get(key))
                         
-                        # Add allergens if available
-                        if entree.get('Allergens'):
-                            email_content += f'<div class="entree-details">⚠️ Allergens: {entree["Allergens"]}</div>\n'
-                        
-                        email_content += '</div>\n'
+                        # One fragment per entree keeps the parts list short
+                        parts.append(f'<div class="entree-item">\n<div class="entree-name">{entree_name}</div>\n{details}</div>\n')
                 else:
-                    email_content += '<div class="no-menu">No entrees found for this day</div>\n'
+                    parts.append('<div class="no-menu">No entrees found for this day</div>\n')
             else:
-                email_content += '<div class="no-menu">No menu data available for this day</div>\n'
+                parts.append('<div class="no-menu">No menu data available for this day</div>\n')
             
-            email_content += '</div>\n</div>\n'
+            parts.append('</div>\n</div>\n')
         
-        email_content += """
-    <div class="footer">
-        <p>This email was automatically generated by the school-menu-notifier tool built by Nick Wilson.</p>
-        <p>Data provided by SchoolCafe</p>
-    </div>
-</body>
-</html>
-"""
+        parts.append(_HTML_FOOTER)
         
-        return email_content
+        return ''.join(parts)
 
     def send_email(self, subject: str, html_content: str) -> bool:
         """Send the weekly menu email."""
@@ -319,8 +306,6 @@ class WeeklySchoolMenuNotifier:
     def run(self) -> bool:
         """Main execution method."""
         try:
-            logger.info("Starting Weekly School Menu Notifier...")
-            
             # Get week dates
             week_dates = self.get_week_dates()
             if not week_dates:
@@ -331,29 +316,43 @@ class WeeklySchoolMenuNotifier:
             week_menus = []
             total_entrees = 0
             prek_entrees = {}  # Dictionary to store PreK entree for each date
+            week_entrees = {}  # Entrees for each date, extracted once for counting and formatting
             
-            for date_obj, date_str in week_dates:
-                logger.info(f"Processing {date_obj.strftime('%A %m/%d')}")
-                menu_data = self.fetch_main_menu_data(date_str)
+            # Log in to the SMTP server while the menus are being fetched
+            self.email_sender.connect_in_background()
+            
+            # Fetch every day's main and PreK menus concurrently over the pooled session
+            date_strs = [date_str for _, date_str in week_dates]
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                main_futures = [executor.submit(self.fetch_main_menu_data, date_str) for date_str in date_strs]
+                prek_futures = [executor.submit(self.fetch_prek_menu_data, date_str) for date_str in date_strs]
+                main_results = [_menu_result(future, "main menu", date_str) for future, date_str in zip(main_futures, date_strs)]
+                prek_results = [_menu_result(future, "PreK menu", date_str) for future, date_str in zip(prek_futures, date_strs)]
+            
+            for (date_obj, date_str), menu_data, prek_menu_data in zip(week_dates, main_results, prek_results):
+                day_name = date_obj.strftime('%A')
+                logger.info("Processing %s %s", day_name, date_str[:5])
+                
+                # Extract the day's entrees once for PreK matching, counting and formatting
+                entrees = None
+                if menu_data:
+                    entrees = self.extract_entrees(menu_data)
+                    week_entrees[date_str] = entrees
+                    total_entrees += len(entrees)
+                    logger.info("Found %s entrees for %s", len(entrees), day_name)
+                else:
+                    logger.warning("No menu data found for %s", day_name)
                 
-                # Fetch PreK data to find matching entree
-                prek_menu_data = self.fetch_prek_menu_data(date_str)
+                # Use PreK data to find matching entree
                 if prek_menu_data is not None:
-                    prek_entree = self.find_prek_entree(menu_data, prek_menu_data)
+                    prek_entree = self.find_prek_entree(menu_data, prek_menu_data, entrees)
                     if prek_entree:
                         prek_entrees[date_str] = prek_entree
-                        logger.info(f"PreK entree for {date_obj.strftime('%A')}: {prek_entree}")
+                        logger.info("PreK entree for %s: %s", day_name, prek_entree)
                     else:
-                        logger.info(f"No matching PreK entree found for {date_obj.strftime('%A')}")
+                        logger.info("No matching PreK entree found for %s", day_name)
                 else:
-                    logger.warning(f"Could not fetch PreK menu data for {date_obj.strftime('%A')}")
-                
-                if menu_data:
-                    entrees = self.extract_entrees(menu_data)
-                    total_entrees += len(entrees)
-                    logger.info(f"Found {len(entrees)} entrees for {date_obj.strftime('%A')}")
-                else:
-                    logger.warning(f"No menu data found for {date_obj.strftime('%A')}")
+                    logger.warning("Could not fetch PreK menu data for %s", day_name)
                 
                 week_menus.append((date_obj, date_str, menu_data))
             
@@ -363,22 +362,41 @@ class WeeklySchoolMenuNotifier:
             else:
                 subject = f"Weekly School Lunch Menu - Next Week"
             
-            content = self.format_weekly_email(week_menus, prek_entrees)
-            logger.info(f"Formatted weekly menu with {total_entrees} total entrees across {len(week_dates)} days")
+            content = self.format_weekly_email(week_menus, prek_entrees, week_entrees)
+            logger.info("Formatted weekly menu with %s total entrees across %s days", total_entrees, len(week_dates))
             
-            # Send email
-            success = self.send_email(subject, content)
+            # Send email; in daemon mode only the worker that claims the week sends it
+            lock_name = None
+            if self.config.daemon:
+                lock_name = f"weekly:{self.config.school_id}:{week_dates[0][1]}:{self.config.recipient_emails[0]}"
+            success = send_once(self.menu_cache, lock_name, lambda: self.send_email(subject, content))
+            if success is None:
+                logger.info("Menu for the week of %s is already being sent by another worker - skipping", week_dates[0][1])
+                return True
             return success
             
         except Exception as e:
-            logger.error(f"Unexpected error in main execution: {e}")
+            logger.error("Unexpected error in main execution: %s", e)
             return False
+        finally:
+            self.email_sender.close()
 
 
 def main():
     """Main entry point for the weekly notifier."""
+    # Configure logging here rather than at import so importing the module has no side effects
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     try:
         notifier = WeeklySchoolMenuNotifier()
+        
+        if notifier.config.daemon:
+            run_scheduled(notifier.run, notifier.config.daemon_cron or DEFAULT_DAEMON_CRON)
+            return
+        
         success = notifier.run()
         
         if success:
@@ -388,7 +406,7 @@ def main():
             exit(1)
             
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         exit(1)
 
 
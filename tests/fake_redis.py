@@ -0,0 +1,30 @@
+"""
+In-memory stand-in for the Redis client used by the notifier tests.
+"""
+
+
+class FakeRedis:
+    """Implements the get/set/setex/delete calls RedisMenuCache makes, recording key TTLs."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
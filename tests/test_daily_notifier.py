@@ -9,13 +9,24 @@ import unittest
 from unittest.mock import patch, MagicMock, Mock
 import os
 import sys
-from datetime import datetime, timedelta
+import shutil
+import tempfile
+from datetime import datetime
 import json
+import smtplib
+from email import message_from_bytes
+from email.policy import default as default_policy
 
 # Add the src directory to the path so we can import the modules
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
-from school_menu_notifier.daily_notifier import SchoolMenuNotifier
+from school_menu_notifier.daily_notifier import SchoolMenuNotifier, main
+from school_menu_notifier.common.menu_cache import RedisMenuCache
+
+# The shared test doubles live next to the tests
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redis import FakeRedis
 
 
 class TestSchoolMenuNotifier(unittest.TestCase):
@@ -35,15 +46,21 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         os.environ['SMTP_SERVER'] = 'test.smtp.com'
         os.environ['SMTP_PORT'] = '587'
         os.environ['TEST_RUN'] = 'false'
+        
+        # Isolate the menu response cache per test
+        self.cache_dir = tempfile.mkdtemp()
+        os.environ['MENU_CACHE_DIR'] = self.cache_dir
 
     def tearDown(self):
         """Clean up after each test method."""
         # Clear environment variables
         for key in ['SENDER_EMAIL', 'SENDER_PASSWORD', 'RECIPIENT_EMAIL', 
                    'ADDITIONAL_RECIPIENTS', 'SCHOOL_ID', 'GRADE', 'SERVING_LINE', 
-                   'MEAL_TYPE', 'SMTP_SERVER', 'SMTP_PORT', 'TEST_RUN']:
+                   'MEAL_TYPE', 'SMTP_SERVER', 'SMTP_PORT', 'TEST_RUN',
+                   'MENU_CACHE_DIR', 'MENU_CACHE_TTL', 'DAEMON', 'DAEMON_CRON', 'SEND_ON_WEEKENDS']:
             if key in os.environ:
                 del os.environ[key]
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
 
     def test_init_with_defaults(self):
         """Test initialization with default values."""
@@ -64,6 +81,15 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         self.assertEqual(notifier.config.smtp_server, 'smtp.gmail.com')
         self.assertEqual(notifier.config.smtp_port, 587)
 
+    def test_init_default_cache_dir_is_per_user(self):
+        """Test the menu cache defaults to a per-user directory rather than the shared temp dir."""
+        del os.environ['MENU_CACHE_DIR']
+        
+        notifier = SchoolMenuNotifier()
+        
+        self.assertEqual(os.path.basename(notifier.config.cache_dir), 'school-menu-notifier')
+        self.assertNotEqual(os.path.dirname(notifier.config.cache_dir), tempfile.gettempdir())
+
     def test_init_with_custom_values(self):
         """Test initialization with custom environment variables."""
         notifier = SchoolMenuNotifier()
@@ -103,13 +129,40 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         # Should fall back to default port
         self.assertEqual(notifier.config.smtp_port, 587)
 
+    def test_init_strips_whitespace_and_rejects_negative_ints(self):
+        """Test settings are stripped and negative integers fall back to defaults."""
+        os.environ['GRADE'] = '  03  '
+        os.environ['SMTP_PORT'] = ' 465 '
+        os.environ['MENU_CACHE_TTL'] = '-5'
+        
+        notifier = SchoolMenuNotifier()
+        
+        self.assertEqual(notifier.config.grade, '03')
+        self.assertEqual(notifier.config.smtp_port, 465)
+        self.assertEqual(notifier.config.cache_ttl, 43200)
+
+    def test_init_unset_int_defaults_log_at_debug(self):
+        """Test unset integer settings log their default at DEBUG and invalid ones warn."""
+        del os.environ['SMTP_PORT']
+
+        with self.assertLogs('school_menu_notifier.common.config', level='DEBUG') as logs:
+            SchoolMenuNotifier()
+
+        self.assertIn('DEBUG:school_menu_notifier.common.config:MENU_CACHE_TTL not set, using default 43200', logs.output)
+        self.assertFalse([line for line in logs.output if 'not set' in line and not line.startswith('DEBUG:')])
+
+        os.environ['MENU_CACHE_TTL'] = 'soon'
+        with self.assertLogs('school_menu_notifier.common.config', level='WARNING') as logs:
+            SchoolMenuNotifier()
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Invalid MENU_CACHE_TTL 'soon'", logs.output[0])
+
     def test_multiple_recipients(self):
         """Test handling of multiple recipients."""
         notifier = SchoolMenuNotifier()
         
-        self.assertEqual(len(notifier.config.recipient_emails), 2)
-        self.assertIn('recipient@example.com', notifier.config.recipient_emails)
-        self.assertIn('additional@example.com', notifier.config.recipient_emails)
+        self.assertEqual(notifier.config.recipient_emails, ['recipient@example.com', 'additional@example.com'])
 
     def test_multiple_recipients_with_duplicates(self):
         """Test handling of duplicate recipients."""
@@ -118,30 +171,38 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         
         notifier = SchoolMenuNotifier()
         
-        # Should remove duplicates
-        self.assertEqual(len(notifier.config.recipient_emails), 2)
-        self.assertIn('same@example.com', notifier.config.recipient_emails)
-        self.assertIn('other@example.com', notifier.config.recipient_emails)
+        # Should remove duplicates, keeping the primary recipient first
+        self.assertEqual(notifier.config.recipient_emails, ['same@example.com', 'other@example.com'])
+
+    def test_test_run_accepts_common_true_values(self):
+        """Test TEST_RUN is parsed once into a boolean from common spellings."""
+        for value, expected in (('true', True), ('TRUE', True), ('1', True), ('yes', True),
+                                ('false', False), ('0', False), ('', False)):
+            os.environ['TEST_RUN'] = value
+            notifier = SchoolMenuNotifier()
+            self.assertIs(notifier.config.test_run, expected, value)
 
     def test_get_target_date_normal_mode(self):
         """Test target date calculation in normal mode."""
         os.environ['TEST_RUN'] = 'false'
         notifier = SchoolMenuNotifier()
         
-        target_date = notifier.get_target_date()
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%m/%d/%Y')
+        with patch('school_menu_notifier.daily_notifier.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 8, 18, 23, 59)  # Monday, just before midnight
+            target_date = notifier.get_target_date()
         
-        self.assertEqual(target_date, tomorrow)
+        self.assertEqual(target_date, '08/19/2025')
 
     def test_get_target_date_test_mode(self):
         """Test target date calculation in test mode."""
         os.environ['TEST_RUN'] = 'true'
         notifier = SchoolMenuNotifier()
         
-        target_date = notifier.get_target_date()
-        today = datetime.now().strftime('%m/%d/%Y')
+        with patch('school_menu_notifier.daily_notifier.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 8, 18, 23, 59)  # Monday, just before midnight
+            target_date = notifier.get_target_date()
         
-        self.assertEqual(target_date, today)
+        self.assertEqual(target_date, '08/18/2025')
 
     def test_get_target_date_weekend_detection(self):
         """Test weekend detection in target date calculation."""
@@ -157,16 +218,17 @@ class TestSchoolMenuNotifier(unittest.TestCase):
             # Should detect that Saturday is a weekend
             # The actual weekend detection is in the logging, not return value
 
-    @patch('school_menu_notifier.daily_notifier.requests.get')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
     def test_fetch_menu_data_success(self, mock_get):
         """Test successful menu data fetching."""
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
             'ENTREES': [{'MenuItemDescription': 'Test Entree'}],
             'VEGETABLES': [{'MenuItemDescription': 'Test Vegetable'}]
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         notifier = SchoolMenuNotifier()
@@ -176,13 +238,14 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         self.assertIn('ENTREES', result)
         self.assertIn('VEGETABLES', result)
 
-    @patch('school_menu_notifier.daily_notifier.requests.get')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
     def test_fetch_menu_data_empty_response(self, mock_get):
         """Test handling of empty API response."""
         # Mock empty API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response.headers = {}
+        mock_response.content = json.dumps({}).encode()
         mock_get.return_value = mock_response
         
         notifier = SchoolMenuNotifier()
@@ -191,7 +254,7 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         # Should return empty dict, not None
         self.assertEqual(result, {})
 
-    @patch('school_menu_notifier.daily_notifier.requests.get')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
     def test_fetch_menu_data_api_error(self, mock_get):
         """Test handling of API errors."""
         # Mock API error
@@ -203,15 +266,16 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         self.assertIsNone(result)
         mock_get.assert_called_once()
 
-    @patch('school_menu_notifier.daily_notifier.requests.get')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
     def test_fetch_prek_menu_data_success(self, mock_get):
         """Test successful PreK menu data fetching."""
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
             'ENTREES': [{'MenuItemDescription': 'Test PreK Entree'}]
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         notifier = SchoolMenuNotifier()
@@ -220,6 +284,31 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIn('ENTREES', result)
 
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_prek_menu_data_params(self, mock_get):
+        """Test PreK fetch requests the PK grade from the Main Line."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({}).encode()
+        mock_get.return_value = mock_response
+        
+        notifier = SchoolMenuNotifier()
+        result = notifier.fetch_prek_menu_data('08/19/2025')
+        
+        self.assertEqual(result, {})
+        params = mock_get.call_args.kwargs['params']
+        self.assertEqual(params['Grade'], 'PK')
+        self.assertEqual(params['ServingLine'], 'Main Line')
+        self.assertEqual(params['ServingDate'], '08/19/2025')
+
+    def test_notifiers_share_http_session(self):
+        """Test notifier instances in one process reuse the same HTTP session."""
+        first = SchoolMenuNotifier()
+        second = SchoolMenuNotifier()
+        
+        self.assertIs(first.session, second.session)
+
     def test_find_prek_entree_matching(self):
         """Test finding matching PreK entrees."""
         main_menu = {
@@ -242,6 +331,37 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         
         self.assertEqual(result, 'Cheese Pizza')
 
+    def test_find_prek_entree_prefers_main_line_order(self):
+        """Test the first matching entree follows main line order."""
+        main_menu = {
+            'ENTREES': [
+                {'MenuItemDescription': 'Chicken Nuggets'},
+                {'MenuItemDescription': 'Cheese Pizza'}
+            ]
+        }
+        
+        prek_menu = {
+            'ENTREES': [
+                {'MenuItemDescription': 'Cheese Pizza'},
+                {'MenuItemDescription': 'Chicken Nuggets'}
+            ]
+        }
+        
+        notifier = SchoolMenuNotifier()
+        result = notifier.find_prek_entree(main_menu, prek_menu)
+        
+        self.assertEqual(result, 'Chicken Nuggets')
+
+    def test_find_prek_entree_ignores_unnamed_entrees(self):
+        """Test entrees without a name on both lines never count as the PreK match."""
+        main_menu = {'ENTREES': [{'Calories': 300}, {'MenuItemDescription': 'Cheese Pizza'}]}
+        prek_menu = {'ENTREES': [{'MenuItemDescription': ''}, {'MenuItemDescription': 'Cheese Pizza'}]}
+        
+        notifier = SchoolMenuNotifier()
+        result = notifier.find_prek_entree(main_menu, prek_menu)
+        
+        self.assertEqual(result, 'Cheese Pizza')
+
     def test_find_prek_entree_no_matching(self):
         """Test handling when no PreK entrees match."""
         main_menu = {
@@ -274,6 +394,53 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         result = notifier.find_prek_entree({}, None)
         self.assertIsNone(result)
 
+    def test_get_menu_categories(self):
+        """Test menu categories are ordered and filtered to displayable items."""
+        menu_data = {
+            'MILK': [{'MenuItemDescription': 'Milk'}],
+            'ENTREES': [{'MenuItemDescription': 'Cheese Pizza'}, 'bad item', {'Calories': 100}, {'MenuItemDescription': ''}],
+            'FRUITS': [{'Calories': 50}],
+            'VEGETABLES': 'not a list',
+            'OTHER': [{'MenuItemDescription': 'Ignored'}]
+        }
+        
+        notifier = SchoolMenuNotifier()
+        categories = notifier.get_menu_categories(menu_data)
+        
+        self.assertEqual(categories, [
+            ('ENTREES', [{'MenuItemDescription': 'Cheese Pizza'}]),
+            ('MILK', [{'MenuItemDescription': 'Milk'}])
+        ])
+
+    def test_get_email_subject(self):
+        """Test email subject reflects the display date and test mode."""
+        notifier = SchoolMenuNotifier()
+        formatted_date = notifier.format_display_date('08/19/2025')
+        
+        self.assertEqual(formatted_date, 'Tuesday, August 19, 2025')
+        self.assertEqual(notifier.get_email_subject(formatted_date),
+                         "🍽️ Tomorrow's School Lunch Menu - Tuesday, August 19, 2025")
+        
+        notifier.config.test_run = True
+        self.assertEqual(notifier.get_email_subject(formatted_date),
+                         "🧪 TEST: Today's School Lunch Menu - Tuesday, August 19, 2025")
+        
+        # Unparseable dates are shown as-is
+        self.assertEqual(notifier.format_display_date('not-a-date'), 'not-a-date')
+
+    def test_format_menu_email_uses_given_display_date(self):
+        """Test a precomputed display date and subject are used without rebuilding them."""
+        notifier = SchoolMenuNotifier()
+        
+        with patch.object(notifier, 'format_display_date') as mock_format_display_date, \
+                patch.object(notifier, 'get_email_subject') as mock_get_email_subject:
+            result = notifier.format_menu_email({}, '08/19/2025', None, 'Tuesday, August 19, 2025', 'Menu Subject')
+        
+        mock_format_display_date.assert_not_called()
+        mock_get_email_subject.assert_not_called()
+        self.assertIn('Tuesday, August 19, 2025', result)
+        self.assertIn('<title>Menu Subject</title>', result)
+
     def test_format_menu_email_with_prek(self):
         """Test email formatting with PreK indicator."""
         menu_data = {
@@ -325,12 +492,24 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         # Should include allergen information
         self.assertIn('⚠️ Allergens: Milk,Wheat,Soy', result)
 
+    def test_format_menu_email_escapes_menu_text(self):
+        """Test menu text from the API is HTML-escaped, and still matched for PreK."""
+        menu_data = {'ENTREES': [{'MenuItemDescription': 'Mac & Cheese', 'Allergens': '<Milk>'}]}
+        
+        notifier = SchoolMenuNotifier()
+        result = notifier.format_menu_email(menu_data, '08/19/2025', prek_entree='Mac & Cheese')
+        
+        self.assertIn('Mac &amp; Cheese [Pre-K]', result)
+        self.assertIn('Allergens: &lt;Milk&gt;', result)
+        self.assertNotIn('<Milk>', result)
+
     @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
     def test_send_email_success(self, mock_smtp):
         """Test successful email sending."""
         # Mock SMTP server
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
         
         notifier = SchoolMenuNotifier()
         result = notifier.send_email('Test Subject', '<html>Test Content</html>')
@@ -338,7 +517,151 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         self.assertTrue(result)
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once()
-        mock_server.send_message.assert_called()
+        mock_server.sendmail.assert_called_once()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_send_email_uses_background_session(self, mock_smtp):
+        """Test a session opened by connect_in_background is used for the send."""
+        mock_server = Mock()
+        mock_server.sendmail.return_value = {}
+        mock_server.noop.return_value = (250, b'OK')
+        mock_smtp.return_value = mock_server
+        
+        notifier = SchoolMenuNotifier()
+        notifier.email_sender.connect_in_background()
+        result = notifier.send_email('Test Subject', '<html>Test Content</html>')
+        
+        self.assertTrue(result)
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        mock_server.sendmail.assert_called_once()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_send_email_reuses_open_session(self, mock_smtp):
+        """Test consecutive sends share one logged-in SMTP session until close()."""
+        mock_server = Mock()
+        mock_server.sendmail.return_value = {}
+        mock_server.noop.return_value = (250, b'OK')
+        mock_smtp.return_value = mock_server
+        
+        notifier = SchoolMenuNotifier()
+        self.assertTrue(notifier.send_email('First', '<html>1</html>'))
+        self.assertTrue(notifier.send_email('Second', '<html>2</html>'))
+        
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        self.assertEqual(mock_server.sendmail.call_count, 2)
+        mock_server.quit.assert_not_called()
+        
+        notifier.email_sender.close()
+        mock_server.quit.assert_called_once()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_email_sender_context_manager(self, mock_smtp):
+        """Test messages sent inside a with block share one session that is closed on exit."""
+        mock_server = Mock()
+        mock_server.sendmail.return_value = {}
+        mock_server.noop.return_value = (250, b'OK')
+        mock_smtp.return_value = mock_server
+        
+        notifier = SchoolMenuNotifier()
+        with notifier.email_sender as sender:
+            for recipient in ('one@example.com', 'two@example.com'):
+                sender.send_email('Test Subject', '<html>Test</html>', [recipient])
+            mock_server.quit.assert_not_called()
+        
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        mock_server.quit.assert_called_once()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_send_email_reconnects_when_session_dropped(self, mock_smtp):
+        """Test a session that fails the NOOP health check is replaced."""
+        stale_server = Mock()
+        stale_server.sendmail.return_value = {}
+        stale_server.noop.side_effect = smtplib.SMTPServerDisconnected('gone')
+        fresh_server = Mock()
+        fresh_server.sendmail.return_value = {}
+        mock_smtp.side_effect = [stale_server, fresh_server]
+        
+        notifier = SchoolMenuNotifier()
+        self.assertTrue(notifier.send_email('First', '<html>1</html>'))
+        self.assertTrue(notifier.send_email('Second', '<html>2</html>'))
+        
+        self.assertEqual(mock_smtp.call_count, 2)
+        stale_server.close.assert_called_once()
+        fresh_server.sendmail.assert_called_once()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_send_email_reconnects_when_background_session_dropped(self, mock_smtp):
+        """Test a background session the server dropped while menus were fetched is replaced."""
+        stale_server = Mock()
+        stale_server.noop.side_effect = smtplib.SMTPServerDisconnected('gone')
+        fresh_server = Mock()
+        fresh_server.sendmail.return_value = {}
+        mock_smtp.side_effect = [stale_server, fresh_server]
+        
+        notifier = SchoolMenuNotifier()
+        notifier.email_sender.connect_in_background()
+        result = notifier.send_email('Test Subject', '<html>Test Content</html>')
+        
+        self.assertTrue(result)
+        self.assertEqual(mock_smtp.call_count, 2)
+        stale_server.close.assert_called_once()
+        stale_server.sendmail.assert_not_called()
+        fresh_server.sendmail.assert_called_once()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_close_quits_unused_background_session(self, mock_smtp):
+        """Test close() ends a background session that was never used."""
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+        
+        notifier = SchoolMenuNotifier()
+        notifier.email_sender.connect_in_background()
+        notifier.email_sender.close()
+        
+        mock_server.quit.assert_called_once()
+        mock_server.sendmail.assert_not_called()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_send_email_message_content(self, mock_smtp):
+        """Test the sent message carries the subject and HTML body."""
+        mock_server = Mock()
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
+        
+        notifier = SchoolMenuNotifier()
+        notifier.send_email('🍽️ Test Subject', '<html>Test Content</html>')
+        
+        from_addr, to_addrs, msg_bytes = mock_server.sendmail.call_args[0]
+        msg = message_from_bytes(msg_bytes, policy=default_policy)
+        
+        self.assertEqual(from_addr, 'test@example.com')
+        self.assertEqual(msg['Subject'], '🍽️ Test Subject')
+        self.assertEqual(msg.get_content_type(), 'text/html')
+        self.assertIn('<html>Test Content</html>', msg.get_content())
+        # Recipients are only on the envelope, not in the headers
+        self.assertNotIn('recipient@example.com', msg['To'])
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_send_email_body_encoding(self, mock_smtp):
+        """Test the HTML body is sent unencoded over 8BITMIME and quoted-printable otherwise."""
+        mock_server = Mock()
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
+        notifier = SchoolMenuNotifier()
+        
+        for has_8bitmime, expected_cte, expected_options in ((True, '8bit', ('BODY=8BITMIME',)),
+                                                             (False, 'quoted-printable', ())):
+            mock_server.has_extn.return_value = has_8bitmime
+            notifier.send_email('Test Subject', '<html>🍕 Pizza</html>')
+            
+            msg = message_from_bytes(mock_server.sendmail.call_args[0][2], policy=default_policy)
+            self.assertEqual(msg['Content-Transfer-Encoding'], expected_cte)
+            self.assertEqual(mock_server.sendmail.call_args.kwargs['mail_options'], expected_options)
+            self.assertIn('🍕 Pizza', msg.get_content())
+            notifier.email_sender.close()
 
     @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
     def test_send_email_test_mode_primary_only(self, mock_smtp):
@@ -347,14 +670,16 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         
         # Mock SMTP server
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
         
         notifier = SchoolMenuNotifier()
         result = notifier.send_email('Test Subject', '<html>Test Content</html>')
         
         self.assertTrue(result)
         # Should only send to primary recipient (first in list)
-        self.assertEqual(mock_server.send_message.call_count, 1)
+        mock_server.sendmail.assert_called_once()
+        self.assertEqual(mock_server.sendmail.call_args[0][1], ['recipient@example.com'])
 
     @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
     def test_send_email_normal_mode_all_recipients(self, mock_smtp):
@@ -363,14 +688,160 @@ class TestSchoolMenuNotifier(unittest.TestCase):
         
         # Mock SMTP server
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
         
         notifier = SchoolMenuNotifier()
         result = notifier.send_email('Test Subject', '<html>Test Content</html>')
         
         self.assertTrue(result)
-        # Should send to all recipients
-        self.assertEqual(mock_server.send_message.call_count, 2)
+        # Should send to all recipients in a single transaction
+        mock_server.sendmail.assert_called_once()
+        self.assertEqual(mock_server.sendmail.call_args[0][1], ['recipient@example.com', 'additional@example.com'])
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP_SSL')
+    def test_send_email_implicit_tls_on_port_465(self, mock_smtp_ssl, mock_smtp):
+        """Test email sending uses SMTP_SSL without STARTTLS on port 465."""
+        os.environ['SMTP_PORT'] = '465'
+        
+        mock_server = Mock()
+        mock_server.sendmail.return_value = {}
+        mock_smtp_ssl.return_value = mock_server
+        
+        notifier = SchoolMenuNotifier()
+        result = notifier.send_email('Test Subject', '<html>Test Content</html>')
+        
+        self.assertTrue(result)
+        mock_smtp.assert_not_called()
+        mock_server.starttls.assert_not_called()
+        mock_server.login.assert_called_once()
+
+    @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
+    def test_send_email_partial_refusal(self, mock_smtp):
+        """Test email sending succeeds when only some recipients are refused."""
+        mock_server = Mock()
+        mock_server.sendmail.return_value = {'additional@example.com': (550, b'User unknown')}
+        mock_smtp.return_value = mock_server
+        
+        notifier = SchoolMenuNotifier()
+        result = notifier.send_email('Test Subject', '<html>Test Content</html>')
+        
+        self.assertTrue(result)
+        mock_server.sendmail.assert_called_once()
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_run_fetches_main_and_prek_menus(self, mock_get):
+        """Test run fetches both main and PreK menus over the shared session."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Cheese Pizza'}]
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        with patch('school_menu_notifier.common.email_sender.smtplib.SMTP') as mock_smtp:
+            mock_server = Mock()
+            mock_server.sendmail.return_value = {}
+            mock_server.noop.return_value = (250, b'OK')
+            mock_smtp.return_value = mock_server
+            
+            notifier = SchoolMenuNotifier()
+            with patch.object(notifier, 'get_target_datetime', return_value=datetime(2025, 8, 19)):  # Tuesday
+                result = notifier.run()
+        
+        self.assertTrue(result)
+        self.assertEqual(mock_get.call_count, 2)
+        grades = sorted(call.kwargs['params']['Grade'] for call in mock_get.call_args_list)
+        self.assertEqual(grades, ['02', 'PK'])
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_run_skips_fetch_on_weekend(self, mock_get):
+        """Test run sends the no-menu email without calling the API for weekend dates when asked to."""
+        os.environ['SEND_ON_WEEKENDS'] = 'true'
+        
+        with patch('school_menu_notifier.common.email_sender.smtplib.SMTP') as mock_smtp:
+            mock_server = Mock()
+            mock_server.sendmail.return_value = {}
+            mock_server.noop.return_value = (250, b'OK')
+            mock_smtp.return_value = mock_server
+            
+            notifier = SchoolMenuNotifier()
+            with patch.object(notifier, 'get_target_datetime', return_value=datetime(2025, 8, 16)):  # Saturday
+                result = notifier.run()
+        
+        self.assertTrue(result)
+        mock_get.assert_not_called()
+        mock_server.sendmail.assert_called_once()
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_run_skips_weekend_by_default(self, mock_get):
+        """Test scheduled runs for a weekend date succeed without fetching or emailing."""
+        with patch('school_menu_notifier.common.email_sender.smtplib.SMTP') as mock_smtp:
+            notifier = SchoolMenuNotifier()
+            with patch.object(notifier, 'get_target_datetime', return_value=datetime(2025, 8, 16)):  # Saturday
+                result = notifier.run()
+        
+        self.assertTrue(result)
+        mock_get.assert_not_called()
+        mock_smtp.assert_not_called()
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_run_daemon_skips_send_when_lock_held(self, mock_get):
+        """Test only the DAEMON worker that claims the day's lock sends the email."""
+        os.environ['DAEMON'] = 'true'
+        os.environ['SEND_ON_WEEKENDS'] = 'true'
+        
+        client = FakeRedis()
+        with patch('school_menu_notifier.common.email_sender.smtplib.SMTP') as mock_smtp:
+            mock_server = Mock()
+            mock_server.sendmail.return_value = {}
+            mock_server.noop.return_value = (250, b'OK')
+            mock_smtp.return_value = mock_server
+            
+            results = []
+            for _ in range(2):
+                notifier = SchoolMenuNotifier()
+                notifier.menu_cache = RedisMenuCache(client, 0)
+                with patch.object(notifier, 'get_target_datetime', return_value=datetime(2025, 8, 16)):  # Saturday
+                    results.append(notifier.run())
+        
+        self.assertEqual(results, [True, True])
+        mock_server.sendmail.assert_called_once()
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_run_daemon_releases_lock_when_send_fails(self, mock_get):
+        """Test a failed DAEMON send releases the day's lock so a retry can send it."""
+        os.environ['DAEMON'] = 'true'
+        os.environ['SEND_ON_WEEKENDS'] = 'true'
+        
+        client = FakeRedis()
+        results = []
+        for sent in (False, True):
+            notifier = SchoolMenuNotifier()
+            notifier.menu_cache = RedisMenuCache(client, 0)
+            with patch.object(notifier, 'get_target_datetime', return_value=datetime(2025, 8, 16)), \
+                    patch.object(notifier, 'send_email', return_value=sent) as mock_send:
+                results.append(notifier.run())
+            mock_send.assert_called_once()
+        
+        self.assertEqual(results, [False, True])
+        # The successful send keeps its lock so other workers still skip the day
+        self.assertEqual(len(client.data), 1)
+
+    @patch('school_menu_notifier.daily_notifier.run_scheduled')
+    @patch.object(SchoolMenuNotifier, 'run')
+    def test_main_daemon_mode(self, mock_run, mock_run_scheduled):
+        """Test DAEMON mode schedules the notifier instead of running it once."""
+        os.environ['DAEMON'] = 'true'
+        os.environ['DAEMON_CRON'] = '30 21 * * sun'
+        
+        main()
+        
+        mock_run.assert_not_called()
+        mock_run_scheduled.assert_called_once()
+        self.assertEqual(mock_run_scheduled.call_args[0][1], '30 21 * * sun')
 
     def test_validation_missing_required_vars(self):
         """Test validation fails with missing required environment variables."""
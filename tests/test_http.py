@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared SchoolCafe HTTP session and cached menu fetching
+
+These tests ensure that future changes don't break existing functionality.
+"""
+
+import unittest
+from unittest.mock import patch, Mock
+import os
+import sys
+import shutil
+import tempfile
+import json
+import requests
+
+# Add the src directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from school_menu_notifier.common.http import API_BASE_URL, create_session, fetch_menu, get_session
+from school_menu_notifier.common.menu_cache import MenuCache
+
+
+class TestFetchMenu(unittest.TestCase):
+    """Test cases for fetch_menu and the API session."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        # Isolate the menu response cache per test
+        self.cache_dir = tempfile.mkdtemp()
+        self.menu_cache = MenuCache(self.cache_dir, 43200)
+        self.session = create_session()
+        self.params = {
+            'SchoolId': 'test-school-id',
+            'ServingLine': 'Test Line',
+            'MealType': 'Breakfast',
+            'Grade': '02',
+            'PersonId': 'null'
+        }
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def fetch(self, serving_date):
+        """Fetch the test menu for a date through the test cache."""
+        return fetch_menu(self.session, self.menu_cache, API_BASE_URL, dict(self.params, ServingDate=serving_date))
+
+    def test_create_session_headers(self):
+        """Test the session sends the standard API headers and requests' default accept-encoding."""
+        self.assertEqual(self.session.headers['origin'], 'https://www.schoolcafe.com')
+        self.assertEqual(self.session.headers['accept-encoding'], requests.utils.DEFAULT_ACCEPT_ENCODING)
+        self.assertTrue(self.session.headers['accept-encoding'].startswith('gzip, deflate'))
+
+    def test_get_session_is_shared(self):
+        """Test the process-wide session is created once and reused."""
+        self.assertIs(get_session(), get_session())
+
+    @patch('school_menu_notifier.common.http.json_loads')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_blank_body_skips_parsing(self, mock_get, mock_json_loads):
+        """Test empty-day bodies return an empty menu without JSON parsing."""
+        for body in (b'', b' ', b'[]', b'null'):
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.headers = {}
+            mock_response.content = body
+            mock_get.return_value = mock_response
+            
+            self.assertEqual(self.fetch('08/19/2025'), {}, body)
+        
+        mock_json_loads.assert_not_called()
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_timeout(self, mock_get):
+        """Test a timed-out request is logged as a timeout and returns None."""
+        mock_get.side_effect = requests.exceptions.ReadTimeout("read timed out")
+        
+        with self.assertLogs('school_menu_notifier.common.http', level='ERROR') as logs:
+            result = self.fetch('08/19/2025')
+        
+        self.assertIsNone(result)
+        self.assertIn('Timed out fetching menu data', logs.output[0])
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_invalid_json(self, mock_get):
+        """Test handling of a response body that is not valid JSON."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'<html>Service Unavailable</html>'
+        mock_response.headers = {'ETag': '"error-page"'}
+        mock_get.return_value = mock_response
+        
+        result = self.fetch('08/19/2025')
+        
+        self.assertIsNone(result)
+        # Neither the body nor its validator is cached, so the next fetch asks the API again
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        mock_response.content = json.dumps({'ENTREES': [{'MenuItemDescription': 'Test Entree'}]}).encode()
+        self.assertEqual(self.fetch('08/19/2025'), {'ENTREES': [{'MenuItemDescription': 'Test Entree'}]})
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_uses_cache(self, mock_get):
+        """Test a repeated fetch for the same date is served from the menu cache."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        first = self.fetch('08/19/2025')
+        second = self.fetch('08/19/2025')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+        
+        # A different date is not served from the cache
+        self.fetch('08/20/2025')
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_cache_disabled(self, mock_get):
+        """Test a cache TTL of 0 disables the menu cache."""
+        self.menu_cache.ttl = 0
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        self.fetch('08/19/2025')
+        self.fetch('08/19/2025')
+        
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_stale_cache_fallback(self, mock_get):
+        """Test an expired cache entry is used when the API is unreachable."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        self.fetch('08/19/2025')
+        
+        # Expire the cached entry, then make the API fail
+        for name in os.listdir(self.cache_dir):
+            os.utime(os.path.join(self.cache_dir, name), (0, 0))
+        mock_get.side_effect = requests.exceptions.ConnectionError("API down")
+        
+        result = self.fetch('08/19/2025')
+        
+        self.assertEqual(result, {'ENTREES': [{'MenuItemDescription': 'Test Entree'}]})
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_stale_empty_body_fallback(self, mock_get):
+        """Test an expired empty-day body is used as an empty menu when the API is unreachable."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b''
+        mock_get.return_value = mock_response
+        
+        self.assertEqual(self.fetch('08/19/2025'), {})
+        
+        # Expire the cached entry, then make the API fail
+        for name in os.listdir(self.cache_dir):
+            os.utime(os.path.join(self.cache_dir, name), (0, 0))
+        mock_get.side_effect = requests.exceptions.ConnectionError("API down")
+        
+        result = self.fetch('08/19/2025')
+
+        self.assertEqual(result, {})
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_refetches_cached_empty_day(self, mock_get):
+        """Test a cached empty day is fetched again so a menu published later is picked up."""
+        empty_response = Mock()
+        empty_response.status_code = 200
+        empty_response.headers = {}
+        empty_response.content = b'{}'
+        mock_get.return_value = empty_response
+
+        self.assertEqual(self.fetch('08/19/2025'), {})
+
+        # The menu is published after the first run
+        menu_response = Mock()
+        menu_response.status_code = 200
+        menu_response.headers = {}
+        menu_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
+        }).encode()
+        mock_get.return_value = menu_response
+
+        expected = {'ENTREES': [{'MenuItemDescription': 'Test Entree'}]}
+        self.assertEqual(self.fetch('08/19/2025'), expected)
+        self.assertEqual(mock_get.call_count, 2)
+
+        # The real menu is cached as usual
+        self.assertEqual(self.fetch('08/19/2025'), expected)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_conditional_get(self, mock_get):
+        """Test an expired cache entry is revalidated with its ETag and reused on 304."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"menu-v1"'}
+        mock_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        self.fetch('08/19/2025')
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {})
+        
+        # Expire the cached entry; the API answers the revalidation with 304
+        for name in os.listdir(self.cache_dir):
+            os.utime(os.path.join(self.cache_dir, name), (0, 0))
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        not_modified.content = b''
+        mock_get.return_value = not_modified
+        
+        result = self.fetch('08/19/2025')
+        
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"menu-v1"'})
+        self.assertEqual(result, {'ENTREES': [{'MenuItemDescription': 'Test Entree'}]})
+        
+        # The revalidated copy is fresh again
+        self.fetch('08/19/2025')
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_not_modified_without_cache(self, mock_get):
+        """Test a 304 with no cached copy is a failure and is not cached as an empty day."""
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        not_modified.content = b''
+        mock_get.return_value = not_modified
+
+        result = self.fetch('08/19/2025')
+
+        self.assertIsNone(result)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
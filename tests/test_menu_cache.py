@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the menu response caches and the send lock
+
+These tests ensure that future changes don't break existing functionality.
+"""
+
+import unittest
+from unittest.mock import Mock
+import os
+import sys
+import shutil
+import tempfile
+
+# Add the src directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from school_menu_notifier.common.menu_cache import REDIS_STALE_TTL, MenuCache, RedisMenuCache, send_once
+
+# The shared test doubles live next to the tests
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redis import FakeRedis
+
+
+class TestMenuCache(unittest.TestCase):
+    """Test cases for MenuCache, RedisMenuCache and send_once."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_disk_menu_cache(self):
+        """Test the disk cache returns expired entries only when stale copies are allowed."""
+        cache = MenuCache(self.cache_dir, 3600)
+        key_parts = ('school', '08/19/2025', 'Main Line', '01', 'Lunch')
+        
+        self.assertIsNone(cache.get(*key_parts))
+        cache.set(b'{"ENTREES": []}', *key_parts)
+        self.assertEqual(cache.get(*key_parts), b'{"ENTREES": []}')
+        
+        os.utime(cache.get_path(*key_parts), (0, 0))
+        self.assertIsNone(cache.get(*key_parts))
+        self.assertEqual(cache.get(*key_parts, allow_stale=True), b'{"ENTREES": []}')
+
+    def test_redis_menu_cache(self):
+        """Test the Redis cache stores responses with a TTL and a stale fallback copy."""
+        client = FakeRedis()
+        cache = RedisMenuCache(client, 3600)
+        key_parts = ('school', '08/19/2025', 'Main Line', '01', 'Lunch')
+        
+        self.assertIsNone(cache.get(*key_parts))
+        cache.set(b'{"ENTREES": []}', *key_parts)
+        self.assertEqual(cache.get(*key_parts), b'{"ENTREES": []}')
+        self.assertEqual(client.ttls[cache.get_key(*key_parts)], 3600)
+        # The stale fallback copy outlives the TTL but still expires
+        self.assertEqual(client.ttls[cache.get_key(*key_parts) + ':stale'], REDIS_STALE_TTL)
+        
+        # Simulate the timed key expiring; only the stale copy remains
+        del client.data[cache.get_key(*key_parts)]
+        self.assertIsNone(cache.get(*key_parts))
+        self.assertEqual(cache.get(*key_parts, allow_stale=True), b'{"ENTREES": []}')
+
+    def test_send_once_skips_when_lock_held(self):
+        """Test only the caller that claims the lock sends, and a successful send keeps the lock."""
+        cache = RedisMenuCache(FakeRedis(), 3600)
+        send = Mock(return_value=True)
+        
+        self.assertTrue(send_once(cache, 'daily:08/19/2025', send))
+        self.assertIsNone(send_once(cache, 'daily:08/19/2025', send))
+        send.assert_called_once()
+
+    def test_send_once_releases_lock_when_send_fails(self):
+        """Test a failed send releases the lock so a retry can send."""
+        cache = RedisMenuCache(FakeRedis(), 3600)
+        
+        self.assertFalse(send_once(cache, 'daily:08/19/2025', Mock(return_value=False)))
+        self.assertTrue(send_once(cache, 'daily:08/19/2025', Mock(return_value=True)))
+
+    def test_send_once_without_lock_name(self):
+        """Test a send without a lock name always goes out."""
+        cache = Mock()
+        
+        self.assertTrue(send_once(cache, None, Mock(return_value=True)))
+        cache.acquire_lock.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
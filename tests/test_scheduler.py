@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the DAEMON mode scheduler
+
+These tests ensure that future changes don't break existing functionality.
+"""
+
+import unittest
+from unittest.mock import patch, Mock
+import os
+import sys
+from datetime import datetime
+
+# Add the src directory to the path so we can import the modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from school_menu_notifier.common.scheduler import run_scheduled, translate_crontab
+
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for the crontab translation and run_scheduled."""
+
+    def test_translate_crontab_numeric_days(self):
+        """Test numeric crontab days count from Sunday = 0, not APScheduler's Monday = 0."""
+        self.assertEqual(translate_crontab('0 22 * * 0,1-4'), '0 22 * * sun,mon,tue,wed,thu')
+        self.assertEqual(translate_crontab('0 22 * * 7'), '0 22 * * sun')
+        self.assertEqual(translate_crontab('0 22 * * */2'), '0 22 * * sun,tue,thu,sat')
+        self.assertEqual(translate_crontab('0 22 * * sun,mon-thu'), '0 22 * * sun,mon-thu')
+        self.assertEqual(translate_crontab('0 22 * * *'), '0 22 * * *')
+        self.assertEqual(translate_crontab('0 22 * * mon-fri/2'), '0 22 * * mon-fri/2')
+        self.assertEqual(translate_crontab('0 22 * * 1,wed'), '0 22 * * mon,wed')
+        
+        for expression in ('0 22 * * mon-3', '0 22 * * 8', '0 22 * *'):
+            with self.assertRaises(ValueError):
+                translate_crontab(expression)
+
+    def test_run_scheduled_numeric_days(self):
+        """Test a numeric DAEMON_CRON fires on the same weekdays as the workflow cron."""
+        try:
+            import apscheduler  # noqa: F401
+        except ImportError:
+            self.skipTest("apscheduler is not installed")
+        
+        with patch('apscheduler.schedulers.blocking.BlockingScheduler.start'), \
+                patch('apscheduler.schedulers.blocking.BlockingScheduler.add_job') as mock_add_job:
+            run_scheduled(Mock(), '0 22 * * 0,1-4')
+        
+        trigger = mock_add_job.call_args[0][1]
+        fire_time = datetime(2025, 8, 16, tzinfo=trigger.timezone)  # Saturday
+        weekdays = []
+        for _ in range(5):
+            fire_time = trigger.get_next_fire_time(None, fire_time)
+            weekdays.append(fire_time.strftime('%a'))
+            fire_time = fire_time.replace(minute=1)
+        self.assertEqual(weekdays, ['Sun', 'Mon', 'Tue', 'Wed', 'Thu'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,13 +9,23 @@ import unittest
 from unittest.mock import patch, MagicMock, Mock
 import os
 import sys
+import shutil
+import tempfile
 from datetime import datetime, timedelta
 import json
+import requests
 
 # Add the src directory to the path so we can import the modules
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
+from school_menu_notifier.daily_notifier import SchoolMenuNotifier
 from school_menu_notifier.weekly_notifier import WeeklySchoolMenuNotifier
+from school_menu_notifier.common.menu_cache import RedisMenuCache
+
+# The shared test doubles live next to the tests
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redis import FakeRedis
 
 
 class TestWeeklySchoolMenuNotifier(unittest.TestCase):
@@ -35,15 +45,20 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         os.environ['SMTP_SERVER'] = 'test.smtp.com'
         os.environ['SMTP_PORT'] = '587'
         os.environ['TEST_RUN'] = 'false'
+        
+        # Isolate the menu response cache per test
+        self.cache_dir = tempfile.mkdtemp()
+        os.environ['MENU_CACHE_DIR'] = self.cache_dir
 
     def tearDown(self):
         """Clean up after each test method."""
         # Clear environment variables
         for key in ['SENDER_EMAIL', 'SENDER_PASSWORD', 'RECIPIENT_EMAIL', 
                    'ADDITIONAL_RECIPIENTS', 'SCHOOL_ID', 'GRADE', 'SERVING_LINE', 
-                   'MEAL_TYPE', 'SMTP_SERVER', 'SMTP_PORT', 'TEST_RUN']:
+                   'MEAL_TYPE', 'SMTP_SERVER', 'SMTP_PORT', 'TEST_RUN', 'MENU_CACHE_DIR', 'MENU_CACHE_TTL', 'DAEMON']:
             if key in os.environ:
                 del os.environ[key]
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
 
     def test_init_with_defaults(self):
         """Test initialization with default values."""
@@ -164,16 +179,17 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
             self.assertEqual(week_dates[0][0].strftime('%A'), 'Monday')
             self.assertEqual(week_dates[4][0].strftime('%A'), 'Friday')
 
-    @patch('school_menu_notifier.weekly_notifier.requests.get')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
     def test_fetch_main_menu_data_success(self, mock_get):
         """Test successful main menu data fetching."""
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
             'ENTREES': [{'MenuItemDescription': 'Test Entree'}],
             'VEGETABLES': [{'MenuItemDescription': 'Test Vegetable'}]
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         notifier = WeeklySchoolMenuNotifier()
@@ -182,16 +198,18 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIn('ENTREES', result)
         self.assertIn('VEGETABLES', result)
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], (5.0, 20.0))
 
-    @patch('school_menu_notifier.weekly_notifier.requests.get')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
     def test_fetch_prek_menu_data_success(self, mock_get):
         """Test successful PreK menu data fetching."""
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
             'ENTREES': [{'MenuItemDescription': 'Test PreK Entree'}]
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         notifier = WeeklySchoolMenuNotifier()
@@ -200,6 +218,52 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIn('ENTREES', result)
 
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_data_uses_cache(self, mock_get):
+        """Test a rerun for the same day is served from the menu cache."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        first = WeeklySchoolMenuNotifier().fetch_main_menu_data('08/19/2025')
+        second = WeeklySchoolMenuNotifier().fetch_main_menu_data('08/19/2025')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('school_menu_notifier.common.http.requests.Session.get')
+    def test_fetch_menu_data_stale_cache_fallback(self, mock_get):
+        """Test an expired cached menu is used when the API is unreachable."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
+            'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
+        }).encode()
+        mock_get.return_value = mock_response
+        notifier = WeeklySchoolMenuNotifier()
+        notifier.fetch_main_menu_data('08/19/2025')
+        
+        # Expire every cached entry, then fail the next request
+        for name in os.listdir(self.cache_dir):
+            os.utime(os.path.join(self.cache_dir, name), (0, 0))
+        mock_get.side_effect = requests.exceptions.ConnectionError("API down")
+        
+        result = notifier.fetch_main_menu_data('08/19/2025')
+        
+        self.assertEqual(result, {'ENTREES': [{'MenuItemDescription': 'Test Entree'}]})
+
+    def test_daily_and_weekly_notifiers_share_http_session(self):
+        """Test the daily and weekly notifiers in one process reuse the same HTTP session."""
+        daily = SchoolMenuNotifier()
+        weekly = WeeklySchoolMenuNotifier()
+        
+        self.assertIs(daily.session, weekly.session)
+
     def test_extract_entrees(self):
         """Test extraction of entrees from menu data."""
         menu_data = {
@@ -271,6 +335,17 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         
         self.assertIsNone(result)
 
+    def test_find_prek_entree_uses_extracted_entrees(self):
+        """Test PreK matching uses main entrees the caller already extracted."""
+        main_menu = {'ENTREES': [{'MenuItemDescription': 'Not Extracted'}]}
+        prek_menu = {'ENTREES': [{'MenuItemDescription': 'Cheese Pizza'}]}
+        main_entrees = [{'MenuItemDescription': 'Cheese Pizza'}]
+        
+        notifier = WeeklySchoolMenuNotifier()
+        result = notifier.find_prek_entree(main_menu, prek_menu, main_entrees)
+        
+        self.assertEqual(result, 'Cheese Pizza')
+
     def test_format_weekly_email_with_prek(self):
         """Test weekly email formatting with PreK indicators."""
         # Create test data
@@ -322,6 +397,30 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         self.assertNotIn('[Pre-K]', result)
         self.assertIn('Cheese Pizza', result)
 
+    def test_format_weekly_email_uses_extracted_entrees(self):
+        """Test entrees already extracted by run() are not extracted again."""
+        entrees = [{'MenuItemDescription': 'Cheese Pizza'}]
+        week_menus = [(datetime(2025, 8, 18), '08/18/2025', {'ENTREES': entrees})]
+        
+        notifier = WeeklySchoolMenuNotifier()
+        with patch.object(notifier, 'extract_entrees') as mock_extract_entrees:
+            result = notifier.format_weekly_email(week_menus, {}, {'08/18/2025': entrees})
+        
+        mock_extract_entrees.assert_not_called()
+        self.assertIn('Cheese Pizza', result)
+
+    def test_format_weekly_email_escapes_menu_text(self):
+        """Test entree text from the API is HTML-escaped, and still matched for PreK."""
+        entrees = [{'MenuItemDescription': 'Mac & Cheese', 'Allergens': '<Milk>'}]
+        week_menus = [(datetime(2025, 8, 18), '08/18/2025', {'ENTREES': entrees})]
+        
+        notifier = WeeklySchoolMenuNotifier()
+        result = notifier.format_weekly_email(week_menus, {'08/18/2025': 'Mac & Cheese'})
+        
+        self.assertIn('Mac &amp; Cheese [Pre-K]', result)
+        self.assertIn('Allergens: &lt;Milk&gt;', result)
+        self.assertNotIn('<Milk>', result)
+
     def test_format_weekly_email_test_mode(self):
         """Test weekly email formatting in test mode."""
         os.environ['TEST_RUN'] = 'true'
@@ -369,7 +468,8 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         """Test successful email sending."""
         # Mock SMTP server
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
         
         notifier = WeeklySchoolMenuNotifier()
         result = notifier.send_email('Test Subject', '<html>Test Content</html>')
@@ -377,7 +477,7 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         self.assertTrue(result)
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once()
-        mock_server.send_message.assert_called()
+        mock_server.sendmail.assert_called_once()
 
     @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
     def test_send_email_test_mode_primary_only(self, mock_smtp):
@@ -386,14 +486,16 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         
         # Mock SMTP server
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
         
         notifier = WeeklySchoolMenuNotifier()
         result = notifier.send_email('Test Subject', '<html>Test Content</html>')
         
         self.assertTrue(result)
         # Should only send to primary recipient (first in list)
-        self.assertEqual(mock_server.send_message.call_count, 1)
+        mock_server.sendmail.assert_called_once()
+        self.assertEqual(mock_server.sendmail.call_args[0][1], ['recipient@example.com'])
 
     @patch('school_menu_notifier.common.email_sender.smtplib.SMTP')
     def test_send_email_normal_mode_all_recipients(self, mock_smtp):
@@ -402,35 +504,88 @@ class TestWeeklySchoolMenuNotifier(unittest.TestCase):
         
         # Mock SMTP server
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
         
         notifier = WeeklySchoolMenuNotifier()
         result = notifier.send_email('Test Subject', '<html>Test Content</html>')
         
         self.assertTrue(result)
-        # Should send to all recipients
-        self.assertEqual(mock_server.send_message.call_count, 2)
+        # Should send to all recipients in a single transaction
+        mock_server.sendmail.assert_called_once()
+        self.assertEqual(mock_server.sendmail.call_args[0][1], ['recipient@example.com', 'additional@example.com'])
 
-    @patch('school_menu_notifier.weekly_notifier.requests.get')
+    @patch('school_menu_notifier.common.http.requests.Session.get')
     def test_run_success(self, mock_get):
         """Test successful run method execution."""
         # Mock successful API responses
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
             'ENTREES': [{'MenuItemDescription': 'Test Entree'}]
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         # Mock SMTP
         with patch('school_menu_notifier.common.email_sender.smtplib.SMTP') as mock_smtp:
             mock_server = Mock()
-            mock_smtp.return_value.__enter__.return_value = mock_server
+            mock_server.sendmail.return_value = {}
+            mock_server.noop.return_value = (250, b'OK')
+            mock_smtp.return_value = mock_server
             
             notifier = WeeklySchoolMenuNotifier()
             result = notifier.run()
             
             self.assertTrue(result)
+            # Main line and PreK menus are fetched for every day of the week
+            self.assertEqual(mock_get.call_count, 2 * len(notifier.get_week_dates()))
+
+    def test_run_survives_one_failing_day(self):
+        """Test a fetch that raises for one day still sends the rest of the week."""
+        notifier = WeeklySchoolMenuNotifier()
+        first_date = notifier.get_week_dates()[0][1]
+        
+        def fetch_main_menu_data(serving_date):
+            if serving_date == first_date:
+                raise RuntimeError("bad cached body")
+            return {'ENTREES': [{'MenuItemDescription': 'Test Entree'}]}
+        
+        with patch('school_menu_notifier.common.email_sender.smtplib.SMTP') as mock_smtp, \
+                patch.object(notifier, 'fetch_main_menu_data', side_effect=fetch_main_menu_data), \
+                patch.object(notifier, 'fetch_prek_menu_data', return_value={}):
+            mock_server = Mock()
+            mock_server.sendmail.return_value = {}
+            mock_server.noop.return_value = (250, b'OK')
+            mock_smtp.return_value = mock_server
+            
+            result = notifier.run()
+        
+        self.assertTrue(result)
+        body = mock_server.sendmail.call_args[0][2]
+        self.assertIn(b'Test Entree', body)
+        self.assertIn(b'No menu data available for this day', body)
+
+    def test_run_daemon_sends_week_once_and_retries_after_failure(self):
+        """Test DAEMON workers sharing Redis send the week once, and a failed send is retried."""
+        os.environ['DAEMON'] = 'true'
+        
+        client = FakeRedis()
+        results = []
+        sends = []
+        for sent in (False, True, True):
+            notifier = WeeklySchoolMenuNotifier()
+            notifier.menu_cache = RedisMenuCache(client, 0)
+            with patch('school_menu_notifier.common.email_sender.smtplib.SMTP'), \
+                    patch.object(notifier, 'fetch_main_menu_data', return_value={}), \
+                    patch.object(notifier, 'fetch_prek_menu_data', return_value={}), \
+                    patch.object(notifier, 'send_email', return_value=sent) as mock_send:
+                results.append(notifier.run())
+            sends.append(mock_send.call_count)
+        
+        # The failed send releases the lock, the retry sends, and the third worker skips
+        self.assertEqual(results, [False, True, True])
+        self.assertEqual(sends, [1, 1, 0])
 
     def test_validation_missing_required_vars(self):
         """Test validation fails with missing required environment variables."""